@@ -0,0 +1,7 @@
+"""Micro benchmarks for the Wanas integration.
+
+Run a module with --check to compare against the committed baseline, or
+with --update to record new baseline numbers:
+
+    python -m benchmarks.bench_read_plan --check
+"""
@@ -0,0 +1,63 @@
+"""Benchmark read planning and register decoding."""
+
+from __future__ import annotations
+
+import random
+
+from custom_components.wanas.const import RegisterDataType, get_default_registers
+from custom_components.wanas.coordinator import WanasCoordinator, _build_read_blocks
+
+from .common import main, measure_pair
+
+
+def cases() -> tuple[dict[str, float], dict[str, float]]:
+    """Return timings and the planned block and register counts.
+
+    Planning is gated relative to sorting the same addresses, decoding
+    relative to plain dict lookups of the same registers.
+    """
+    default = [
+        v for k, v in get_default_registers().items()
+        if k.endswith("_address") and isinstance(v, int)
+    ]
+    rng = random.Random(0)
+    large = rng.sample(range(2000), 500)
+    illegal = tuple(rng.sample(range(2000), 40))
+    registers = {address: address for address in range(0x10000)}
+    decode = WanasCoordinator.get_sensor_value
+
+    def decode_all() -> None:
+        for address in range(0x10000):
+            decode(registers, address, RegisterDataType.INT16, 0.1)
+
+    def lookup_all() -> None:
+        for address in range(0x10000):
+            registers.get(address)
+
+    default_blocks = _build_read_blocks(default)
+    large_blocks = _build_read_blocks(large, max_count=64, illegal=illegal)
+    plan_us, sort_us, plan_ratio = measure_pair(
+        lambda: _build_read_blocks(large, max_count=64, illegal=illegal),
+        lambda: sorted(set(large)),
+    )
+    decode_us, lookup_us, decode_ratio = measure_pair(decode_all, lookup_all)
+    return (
+        {
+            "plan_500_illegal_us": plan_us,
+            "sort_500_reference_us": sort_us,
+            "decode_65536_int16_scaled_us": decode_us,
+            "lookup_65536_reference_us": lookup_us,
+        },
+        {
+            "plan_default_blocks": len(default_blocks),
+            "plan_default_registers": sum(count for _start, count in default_blocks),
+            "plan_500_illegal_blocks": len(large_blocks),
+            "plan_500_illegal_registers": sum(count for _start, count in large_blocks),
+            "plan_vs_sort_ratio": plan_ratio,
+            "decode_vs_lookup_ratio": decode_ratio,
+        },
+    )
+
+
+if __name__ == "__main__":
+    main("read_plan", cases)
@@ -0,0 +1,136 @@
+"""Benchmark register snapshots against per-register dict storage."""
+
+from __future__ import annotations
+
+import tracemalloc
+
+from custom_components.wanas.const import get_default_registers
+from custom_components.wanas.coordinator import _build_read_blocks
+from custom_components.wanas.snapshot import RegisterRef, SnapshotLayout
+
+from .common import main, measure_pair
+
+RETAINED = 1000
+CYCLES = 100
+
+
+def _allocation(func) -> tuple[float, float]:
+    """Return (bytes allocated per call, bytes retained per result)."""
+    tracemalloc.start()
+    func()
+    before, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    kept = [func() for _ in range(RETAINED)]
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained = (current - before) / RETAINED
+    del kept
+    tracemalloc.start()
+    func()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, retained
+
+
+def cases() -> tuple[dict[str, float], dict[str, float]]:
+    """Return per-cycle timings and allocations, gated relative to a dict.
+
+    Timings are taken over batches of CYCLES poll cycles. A full cycle
+    builds the data and reads every register once, the way entities read
+    it: the dict by address, the snapshot through RegisterRef offsets.
+    """
+    addresses = [
+        v for k, v in get_default_registers().items()
+        if k.endswith("_address") and isinstance(v, int)
+    ]
+    blocks = _build_read_blocks(addresses)
+    responses = [list(range(start, start + count)) for start, count in blocks]
+    layout = SnapshotLayout(blocks)
+
+    def build_dict() -> dict[int, int]:
+        data: dict[int, int] = {}
+        for (start, _count), registers in zip(blocks, responses):
+            for i, value in enumerate(registers):
+                data[start + i] = value
+        return data
+
+    def build_snapshot():
+        return layout.snapshot(responses)
+
+    data = build_dict()
+    snapshot = build_snapshot()
+
+    def batch(func):
+        def run() -> None:
+            for _ in range(CYCLES):
+                func()
+        return run
+
+    def lookup_dict() -> None:
+        for address in addresses:
+            data.get(address)
+
+    def lookup_snapshot() -> None:
+        for address in addresses:
+            snapshot.get(address)
+
+    refs = [RegisterRef(address) for address in addresses]
+
+    def lookup_refs() -> None:
+        for ref in refs:
+            ref.get(snapshot)
+
+    def cycle_dict() -> None:
+        cycle_data = build_dict()
+        for address in addresses:
+            cycle_data.get(address)
+
+    def cycle_snapshot() -> None:
+        cycle_data = build_snapshot()
+        for ref in refs:
+            ref.get(cycle_data)
+
+    dict_peak, dict_retained = _allocation(build_dict)
+    snapshot_peak, snapshot_retained = _allocation(build_snapshot)
+    snapshot_build, dict_build, build_ratio = measure_pair(
+        batch(build_snapshot), batch(build_dict)
+    )
+    snapshot_lookup, dict_lookup, lookup_ratio = measure_pair(
+        batch(lookup_snapshot), batch(lookup_dict)
+    )
+    ref_lookup, _dict_lookup, ref_lookup_ratio = measure_pair(
+        batch(lookup_refs), batch(lookup_dict)
+    )
+    snapshot_cycle, dict_cycle, cycle_ratio = measure_pair(
+        batch(cycle_snapshot), batch(cycle_dict)
+    )
+    timings = {
+        "dict_build_us": dict_build / CYCLES,
+        "snapshot_build_us": snapshot_build / CYCLES,
+        "dict_lookup_all_us": dict_lookup / CYCLES,
+        "snapshot_lookup_all_us": snapshot_lookup / CYCLES,
+        "snapshot_ref_lookup_all_us": ref_lookup / CYCLES,
+        "dict_cycle_us": dict_cycle / CYCLES,
+        "snapshot_cycle_us": snapshot_cycle / CYCLES,
+    }
+    return (
+        {
+            **timings,
+            "dict_cycle_alloc_bytes": dict_peak,
+            "snapshot_cycle_alloc_bytes": snapshot_peak,
+            "dict_retained_bytes": dict_retained,
+            "snapshot_retained_bytes": snapshot_retained,
+        },
+        {
+            "build_ratio": build_ratio,
+            "lookup_ratio": lookup_ratio,
+            "ref_lookup_ratio": ref_lookup_ratio,
+            "cycle_ratio": cycle_ratio,
+            "cycle_alloc_ratio": snapshot_peak / dict_peak,
+            "retained_ratio": snapshot_retained / dict_retained,
+        },
+    )
+
+
+if __name__ == "__main__":
+    main("snapshot", cases)
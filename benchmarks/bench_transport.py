@@ -0,0 +1,91 @@
+"""Benchmark the native transport against pymodbus on a simulated device."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import statistics
+import time
+
+from pymodbus.client import AsyncModbusTcpClient, AsyncModbusUdpClient
+from pymodbus.framer import FramerType
+
+from custom_components.wanas.const import PROTOCOL_OPTIONS, PROTOCOL_TCP, PROTOCOL_UDP
+from custom_components.wanas.transport import NativeModbusClient
+from tests.simulator import ModbusSimulator
+
+from .common import main
+
+READS = 1000
+REPEAT = 11
+TIMEOUT = 2.0
+
+
+def _pymodbus_client(protocol: str, port: int) -> AsyncModbusTcpClient | AsyncModbusUdpClient:
+    """Create the pymodbus client the coordinator would use."""
+    if protocol == PROTOCOL_UDP:
+        return AsyncModbusUdpClient(
+            host="127.0.0.1", port=port, framer=FramerType.SOCKET, timeout=TIMEOUT
+        )
+    framer = FramerType.SOCKET if protocol == PROTOCOL_TCP else FramerType.RTU
+    return AsyncModbusTcpClient(
+        host="127.0.0.1", port=port, framer=framer, timeout=TIMEOUT
+    )
+
+
+async def _async_time_reads(client, expected: list[int]) -> float:
+    """Return the time per 20 register read in microseconds."""
+    started = time.perf_counter()
+    for _ in range(READS):
+        result = await client.read_holding_registers(29, count=20, device_id=1)
+    elapsed = (time.perf_counter() - started) / READS * 1e6
+    assert list(result.registers) == expected
+    return elapsed
+
+
+async def _async_cases() -> dict[str, float]:
+    """Time both clients over every framing, interleaving their batches."""
+    results: dict[str, float] = {}
+    for protocol in PROTOCOL_OPTIONS:
+        async with ModbusSimulator(protocol) as simulator:
+            expected = simulator.registers[29:49]
+            clients = {
+                "pymodbus": _pymodbus_client(protocol, simulator.port),
+                "native": NativeModbusClient(
+                    "127.0.0.1", simulator.port, protocol, TIMEOUT
+                ),
+            }
+            for client in clients.values():
+                assert await client.connect()
+            ratios: list[float] = []
+            try:
+                for _ in range(REPEAT):
+                    elapsed = {}
+                    for name, client in clients.items():
+                        key = f"{protocol}_{name}_read_us"
+                        elapsed[name] = await _async_time_reads(client, expected)
+                        results[key] = min(results.get(key, elapsed[name]), elapsed[name])
+                    ratios.append(elapsed["native"] / elapsed["pymodbus"])
+                # Each pair ran back to back, so the median ratio shrugs off
+                # batches disturbed by unrelated load
+                results[f"{protocol}_native_vs_pymodbus_ratio"] = statistics.median(
+                    ratios
+                )
+            finally:
+                for client in clients.values():
+                    client.close()
+    return results
+
+
+def cases() -> tuple[dict[str, float], dict[str, float]]:
+    """Return per read round trip timings, gated as native/pymodbus ratios."""
+    logging.getLogger("pymodbus").setLevel(logging.CRITICAL)
+    results = asyncio.run(_async_cases())
+    return (
+        {name: value for name, value in results.items() if name.endswith("_us")},
+        {name: value for name, value in results.items() if name.endswith("_ratio")},
+    )
+
+
+if __name__ == "__main__":
+    main("transport", cases)
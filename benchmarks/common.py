@@ -0,0 +1,109 @@
+"""Shared runner for Wanas benchmarks with a committed baseline.
+
+Absolute timings depend on the machine, so they are only reported. The
+baseline gates on machine independent metrics: ratios between an
+implementation and a reference measured in the same run, and counts such
+as blocks or requests.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import json
+import statistics
+from pathlib import Path
+import sys
+import timeit
+
+BASELINE_FILE = Path(__file__).with_name("baseline.json")
+# A gated metric regresses if it is this many times its baseline
+DEFAULT_THRESHOLD = 1.5
+# Minimum wall time of one timed batch, so micro operations are not
+# dominated by timer resolution and scheduling noise
+MIN_BATCH_SECONDS = 0.5
+
+
+def measure_pair(
+    func: Callable[[], object], reference: Callable[[], object], repeat: int = 9
+) -> tuple[float, float, float]:
+    """Time func against a reference measured in the same run.
+
+    Batches of both are interleaved. Returns the best time per call of each
+    in microseconds and the median of the per-batch ratios, which stays
+    stable when unrelated load disturbs a few batches.
+    """
+    timers = []
+    for candidate in (func, reference):
+        timer = timeit.Timer(candidate)
+        number = 1
+        while timer.timeit(number) < MIN_BATCH_SECONDS / 2:
+            number *= 2
+        timers.append((timer, number))
+    samples: list[tuple[float, float]] = []
+    for _ in range(repeat):
+        func_us, reference_us = (
+            timer.timeit(number) / number * 1e6 for timer, number in timers
+        )
+        samples.append((func_us, reference_us))
+    return (
+        min(func_us for func_us, _reference_us in samples),
+        min(reference_us for _func_us, reference_us in samples),
+        statistics.median(func_us / reference_us for func_us, reference_us in samples),
+    )
+
+
+def _load_baseline() -> dict[str, dict[str, float]]:
+    """Load the committed baseline numbers."""
+    if not BASELINE_FILE.exists():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+def run(
+    suite: str,
+    cases: Callable[[], tuple[dict[str, float], dict[str, float]]],
+    argv: list[str] | None = None,
+) -> int:
+    """Run a benchmark suite and compare or update its baseline.
+
+    cases returns (report, gated): report holds raw numbers that are only
+    printed, gated holds ratios and counts where lower is better, which are
+    compared against the baseline.
+    """
+    parser = argparse.ArgumentParser(description=f"Wanas {suite} benchmark")
+    parser.add_argument("--check", action="store_true", help="fail on regressions")
+    parser.add_argument("--update", action="store_true", help="rewrite the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    report, gated = cases()
+    for name, value in report.items():
+        print(f"{suite}.{name}: {value:.3f}")
+
+    baseline = _load_baseline()
+    previous = baseline.get(suite, {})
+    failed = False
+    for name, value in gated.items():
+        reference = previous.get(name)
+        if reference:
+            ratio = value / reference
+            status = "REGRESSION" if ratio > args.threshold else "ok"
+            failed |= ratio > args.threshold
+            print(f"{suite}.{name}: {value:.3f} (baseline {reference:.3f}, x{ratio:.2f}) {status}")
+        else:
+            print(f"{suite}.{name}: {value:.3f} (no baseline)")
+
+    if args.update:
+        baseline[suite] = {name: round(value, 3) for name, value in gated.items()}
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {BASELINE_FILE}")
+        return 0
+    return 1 if args.check and failed else 0
+
+
+def main(
+    suite: str, cases: Callable[[], tuple[dict[str, float], dict[str, float]]]
+) -> None:
+    """Entry point for benchmark modules."""
+    sys.exit(run(suite, cases))
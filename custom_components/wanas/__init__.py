@@ -2,30 +2,77 @@
 
 from __future__ import annotations
 
+import logging
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from .const import DOMAIN
+from .const import CONF_DEVICE_PROFILE, DOMAIN
 from .coordinator import WanasCoordinator
+from .services import async_setup_services
+
+_LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 type WanasConfigEntry = ConfigEntry[WanasCoordinator]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Wanas integration."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: WanasConfigEntry) -> bool:
     """Set up Wanas from a config entry."""
     coordinator = WanasCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+
+    try:
+        # Entries created before capability probing existed have no profile yet
+        if CONF_DEVICE_PROFILE not in entry.data:
+            try:
+                profile = await coordinator.async_probe()
+            except UpdateFailed as err:
+                _LOGGER.warning(
+                    "Device capability probe failed, using defaults: %s", err
+                )
+            else:
+                hass.config_entries.async_update_entry(
+                    entry, data={**entry.data, CONF_DEVICE_PROFILE: profile.as_dict()}
+                )
+
+        await coordinator.async_config_entry_first_refresh()
+    except BaseException:
+        # Release the request worker and the (possibly handed over) client
+        await coordinator.async_close()
+        raise
 
     entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: WanasConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: WanasConfigEntry) -> None:
+    """Close a probe connection that was never picked up by setup."""
+    if (client := hass.data.get(DOMAIN, {}).pop(entry.unique_id, None)) is not None:
+        client.close()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: WanasConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -0,0 +1,171 @@
+"""Modbus traffic capture for Wanas integration."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+import struct
+import sys
+import time
+
+from .const import MODBUS_MAX_READ_REGISTERS
+
+DEFAULT_CAPTURE_FRAMES = 512
+
+# Exception code recorded when the device did not answer at all
+NO_RESPONSE = 0xFF
+
+CAPTURE_MAGIC = b"WNCP"
+CAPTURE_VERSION = 1
+
+# timestamp, latency, function code, exception code, address, count, payload length
+_FRAME_HEADER = struct.Struct("<ddBBHHH")
+_MAX_PAYLOAD = MODBUS_MAX_READ_REGISTERS * 2
+_SLOT_SIZE = _FRAME_HEADER.size + _MAX_PAYLOAD
+_FILE_HEADER = struct.Struct("<4sBI")
+# Payload registers are stored big-endian, as on the wire
+_PAYLOADS = [struct.Struct(f">{n}H") for n in range(MODBUS_MAX_READ_REGISTERS + 1)]
+_SWAP_PAYLOAD = sys.byteorder == "little"
+
+
+@dataclass(frozen=True)
+class CapturedFrame:
+    """A single recorded Modbus request/response exchange."""
+
+    timestamp: float
+    latency: float
+    function_code: int
+    exception_code: int
+    address: int
+    count: int
+    payload: tuple[int, ...]
+
+    @property
+    def is_error(self) -> bool:
+        """Return true if the exchange ended with an exception or no response."""
+        return self.exception_code != 0
+
+    @property
+    def key(self) -> tuple[int, int, int]:
+        """Return the (function code, address, count) a request is matched on."""
+        return (self.function_code, self.address, self.count)
+
+
+class TrafficRecorder:
+    """Bounded ring buffer of recent Modbus frames.
+
+    Frames are packed into fixed-size slots of a preallocated bytearray, so
+    recording never allocates per frame and memory use stays constant.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPTURE_FRAMES) -> None:
+        """Initialize the recorder."""
+        self.capacity = capacity
+        self._buffer = bytearray(capacity * _SLOT_SIZE)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of frames currently held."""
+        return self._size
+
+    def record(
+        self,
+        function_code: int,
+        address: int,
+        count: int,
+        payload: Sequence[int],
+        latency: float,
+        exception_code: int = 0,
+    ) -> None:
+        """Store a frame, overwriting the oldest one when full.
+
+        An array('H') payload from the native transport is copied into the
+        slot as one block of bytes; register lists are packed with a
+        precompiled struct.
+        """
+        payload = payload[:MODBUS_MAX_READ_REGISTERS]
+        length = len(payload)
+        offset = self._next * _SLOT_SIZE
+        _FRAME_HEADER.pack_into(
+            self._buffer,
+            offset,
+            time.time(),
+            latency,
+            function_code,
+            exception_code,
+            address,
+            count,
+            length,
+        )
+        start = offset + _FRAME_HEADER.size
+        if isinstance(payload, array):
+            # The slice above is a copy, so it can be swapped in place
+            if _SWAP_PAYLOAD:
+                payload.byteswap()
+            self._buffer[start : start + length * 2] = payload
+        else:
+            _PAYLOADS[length].pack_into(self._buffer, start, *payload)
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def clear(self) -> None:
+        """Drop all recorded frames."""
+        self._next = 0
+        self._size = 0
+
+    def frames(self) -> Iterator[CapturedFrame]:
+        """Iterate recorded frames from oldest to newest."""
+        first = (self._next - self._size) % self.capacity
+        for i in range(self._size):
+            offset = ((first + i) % self.capacity) * _SLOT_SIZE
+            yield _unpack_frame(self._buffer, offset)[0]
+
+    def export(self) -> bytes:
+        """Serialize recorded frames into the compact capture format."""
+        out = bytearray(_FILE_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, self._size))
+        first = (self._next - self._size) % self.capacity
+        for i in range(self._size):
+            offset = ((first + i) % self.capacity) * _SLOT_SIZE
+            length = _FRAME_HEADER.unpack_from(self._buffer, offset)[-1]
+            out += self._buffer[offset : offset + _FRAME_HEADER.size + length * 2]
+        return bytes(out)
+
+
+def _unpack_frame(buffer: bytes | bytearray, offset: int) -> tuple[CapturedFrame, int]:
+    """Decode one frame at offset; returns the frame and its packed length."""
+    (
+        timestamp,
+        latency,
+        function_code,
+        exception_code,
+        address,
+        count,
+        length,
+    ) = _FRAME_HEADER.unpack_from(buffer, offset)
+    payload = struct.unpack_from(f">{length}H", buffer, offset + _FRAME_HEADER.size)
+    frame = CapturedFrame(
+        timestamp=timestamp,
+        latency=latency,
+        function_code=function_code,
+        exception_code=exception_code,
+        address=address,
+        count=count,
+        payload=payload,
+    )
+    return frame, _FRAME_HEADER.size + length * 2
+
+
+def load_capture(data: bytes) -> list[CapturedFrame]:
+    """Parse frames produced by TrafficRecorder.export."""
+    magic, version, total = _FILE_HEADER.unpack_from(data)
+    if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION:
+        raise ValueError("Not a Wanas traffic capture")
+    frames: list[CapturedFrame] = []
+    offset = _FILE_HEADER.size
+    for _ in range(total):
+        frame, size = _unpack_frame(data, offset)
+        frames.append(frame)
+        offset += size
+    return frames
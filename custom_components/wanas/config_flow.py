@@ -9,15 +9,27 @@ import voluptuous as vol
 from pymodbus.client import AsyncModbusTcpClient, AsyncModbusUdpClient
 from pymodbus.framer import FramerType
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import section
 
 from .const import (
+    CONF_DEVICE_PROFILE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_NATIVE_TRANSPORT,
     CONF_PROTOCOL,
     CONF_REGISTERS,
     CONF_SHOW_ADVANCED,
     CONF_SLAVE_ID,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_PORT,
     DEFAULT_PROTOCOL,
     DEFAULT_SLAVE_ID,
@@ -28,7 +40,10 @@ from .const import (
     SENSOR_DESCRIPTIONS,
     SWITCH_DESCRIPTIONS,
     get_default_register_config,
+    get_default_registers,
 )
+from .coordinator import _build_read_blocks
+from .probe import WanasDeviceProfile, async_probe_device
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,9 +70,10 @@ def _create_client(
     return AsyncModbusTcpClient(host=host, port=port, framer=FramerType.RTU)
 
 
-async def _test_connection(host: str, port: int, slave_id: int, protocol: str) -> str | None:
+async def _test_connection(
+    client: AsyncModbusTcpClient | AsyncModbusUdpClient, slave_id: int
+) -> str | None:
     """Test Modbus connection. Returns error key or None on success."""
-    client = _create_client(host, port, protocol)
     try:
         connected = await client.connect()
         if not connected:
@@ -70,11 +86,33 @@ async def _test_connection(host: str, port: int, slave_id: int, protocol: str) -
     except Exception:
         _LOGGER.exception("Error testing Modbus connection")
         return "cannot_connect"
-    finally:
-        client.close()
     return None
 
 
+async def _probe_connection(
+    client: AsyncModbusTcpClient | AsyncModbusUdpClient,
+    slave_id: int,
+    registers: dict[str, Any],
+) -> WanasDeviceProfile | None:
+    """Probe device capabilities against the final register map.
+
+    Returns None if the device could not be probed.
+    """
+    addresses = [
+        v for k, v in {**get_default_registers(), **registers}.items()
+        if k.endswith("_address") and isinstance(v, int)
+    ]
+    try:
+        if not client.connected and not await client.connect():
+            return None
+        return await async_probe_device(
+            client, slave_id, _build_read_blocks(addresses)
+        )
+    except Exception:
+        _LOGGER.exception("Error probing Modbus device")
+        return None
+
+
 def _build_register_schema(defaults: dict[str, int | str]) -> vol.Schema:
     """Build a vol.Schema for register address and name configuration."""
     sensor_fields: dict = {}
@@ -113,6 +151,66 @@ class WanasConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._connection_data: dict[str, Any] = {}
+        self._client: AsyncModbusTcpClient | AsyncModbusUdpClient | None = None
+
+    def _close_client(self) -> None:
+        """Close the probe connection if it was not handed over."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _create_entry(
+        self, data: dict[str, Any], options: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Create the entry and hand the probe connection over to setup."""
+        if self._client is not None:
+            self.hass.data.setdefault(DOMAIN, {})[self.unique_id] = self._client
+            self._client = None
+        return self.async_create_entry(
+            title=f"Wanas ({data[CONF_HOST]})",
+            data=data,
+            options=options or {},
+        )
+
+    async def _async_connect(self, data: dict[str, Any]) -> str | None:
+        """Open the connection kept for probing and setup; returns error key."""
+        self._close_client()
+        self._client = _create_client(
+            data[CONF_HOST], data[CONF_PORT], data[CONF_PROTOCOL]
+        )
+        error = await _test_connection(self._client, data[CONF_SLAVE_ID])
+        if error:
+            self._close_client()
+        return error
+
+    async def _async_probe(
+        self, data: dict[str, Any], registers: dict[str, Any]
+    ) -> str | None:
+        """Probe the device and store its profile in data; returns error key.
+
+        The probe reuses the open connection, which is handed over to setup
+        warm. The coordinator applies the profile timeout per request.
+        """
+        if self._client is None:
+            self._client = _create_client(
+                data[CONF_HOST], data[CONF_PORT], data[CONF_PROTOCOL]
+            )
+        profile = await _probe_connection(self._client, data[CONF_SLAVE_ID], registers)
+        if profile is None:
+            return "cannot_connect"
+        data[CONF_DEVICE_PROFILE] = profile.as_dict()
+        return None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> WanasOptionsFlow:
+        """Get the options flow for this handler."""
+        return WanasOptionsFlow()
+
+    @callback
+    def async_remove(self) -> None:
+        """Close the probe connection when the flow is abandoned."""
+        self._close_client()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -121,29 +219,22 @@ class WanasConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            error = await _test_connection(
-                user_input[CONF_HOST],
-                user_input[CONF_PORT],
-                user_input[CONF_SLAVE_ID],
-                user_input[CONF_PROTOCOL],
+            show_advanced = user_input.pop(CONF_SHOW_ADVANCED, False)
+            await self.async_set_unique_id(
+                f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}:{user_input[CONF_SLAVE_ID]}"
             )
+            self._abort_if_unique_id_configured()
+
+            error = await self._async_connect(user_input)
+            if not error and show_advanced:
+                self._connection_data = user_input
+                return await self.async_step_registers()
+            if not error:
+                error = await self._async_probe(user_input, {})
             if error:
                 errors["base"] = error
             else:
-                show_advanced = user_input.pop(CONF_SHOW_ADVANCED, False)
-                await self.async_set_unique_id(
-                    f"{user_input[CONF_HOST]}:{user_input[CONF_PORT]}:{user_input[CONF_SLAVE_ID]}"
-                )
-                self._abort_if_unique_id_configured()
-
-                if show_advanced:
-                    self._connection_data = user_input
-                    return await self.async_step_registers()
-
-                return self.async_create_entry(
-                    title=f"Wanas ({user_input[CONF_HOST]})",
-                    data=user_input,
-                )
+                return self._create_entry(user_input)
 
         return self.async_show_form(
             step_id="user",
@@ -156,6 +247,7 @@ class WanasConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Handle advanced register address configuration."""
         defaults = get_default_register_config()
+        errors: dict[str, str] = {}
 
         if user_input is not None:
             # Flatten nested section data into a single dict
@@ -163,13 +255,60 @@ class WanasConfigFlow(ConfigFlow, domain=DOMAIN):
             for value in user_input.values():
                 if isinstance(value, dict):
                     flat.update(value)
-            return self.async_create_entry(
-                title=f"Wanas ({self._connection_data[CONF_HOST]})",
-                data=self._connection_data,
-                options={CONF_REGISTERS: flat},
-            )
+            error = await self._async_probe(self._connection_data, flat)
+            if error:
+                errors["base"] = error
+                defaults = {**defaults, **flat}
+            else:
+                return self._create_entry(
+                    self._connection_data, options={CONF_REGISTERS: flat}
+                )
 
         return self.async_show_form(
             step_id="registers",
             data_schema=_build_register_schema(defaults),
+            errors=errors,
+        )
+
+
+class WanasOptionsFlow(OptionsFlow):
+    """Handle Wanas options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage polling bounds and transport selection."""
+        errors: dict[str, str] = {}
+        options = self.config_entry.options
+
+        if user_input is not None:
+            if user_input[CONF_MIN_SCAN_INTERVAL] > user_input[CONF_MAX_SCAN_INTERVAL]:
+                errors["base"] = "invalid_interval"
+            else:
+                # Keep register overrides stored in the same options
+                return self.async_create_entry(data={**options, **user_input})
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MIN_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                    vol.Required(
+                        CONF_MAX_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                    vol.Required(
+                        CONF_NATIVE_TRANSPORT,
+                        default=options.get(CONF_NATIVE_TRANSPORT, False),
+                    ): bool,
+                }
+            ),
+            errors=errors,
         )
@@ -13,11 +13,48 @@ DOMAIN = "wanas"
 DEFAULT_PORT = 502
 DEFAULT_SLAVE_ID = 1
 DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_MIN_SCAN_INTERVAL = 10
+DEFAULT_MAX_SCAN_INTERVAL = 120
+DEFAULT_TIMEOUT = 3.0
+MIN_TIMEOUT = 1.0
+MAX_TIMEOUT = 10.0
+RTT_TIMEOUT_FACTOR = 10
+SHUTDOWN_TIMEOUT = 2.0
+
+# Adaptive polling: raw register change per cycle considered noise, change
+# rates (raw units per second) to speed up above and back off below, and the
+# interval factors
+NOISE_BAND = 2
+RATE_ACTIVE = 0.05
+RATE_IDLE = 0.01
+INTERVAL_BACKOFF = 1.5
+INTERVAL_SPEEDUP = 0.5
+# Switches whose verify register counts down while a timed mode is active
+TIMED_MODE_SWITCHES = ("vacation", "fireplace", "party")
+
+# High-rate sampling service
+SERVICE_START_HIGH_RATE_SAMPLING = "start_high_rate_sampling"
+SERVICE_STOP_HIGH_RATE_SAMPLING = "stop_high_rate_sampling"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DURATION = "duration"
+ATTR_INTERVAL = "interval"
+ATTR_ADDRESSES = "addresses"
+DEFAULT_HIGH_RATE_INTERVAL = 2
+MIN_HIGH_RATE_INTERVAL = 1
+MAX_HIGH_RATE_DURATION = 4 * 3600
+DEFAULT_HIGH_RATE_ADDRESSES = list(range(8))
+
+# Modbus protocol limit for FC3 (Read Holding Registers)
+MODBUS_MAX_READ_REGISTERS = 125
 
 CONF_SLAVE_ID = "slave_id"
 CONF_PROTOCOL = "protocol"
 CONF_REGISTERS = "registers"
 CONF_SHOW_ADVANCED = "show_advanced"
+CONF_DEVICE_PROFILE = "device_profile"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_NATIVE_TRANSPORT = "native_transport"
 
 PROTOCOL_RTU_OVER_TCP = "rtu_over_tcp"
 PROTOCOL_TCP = "tcp"
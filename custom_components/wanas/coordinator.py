@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-import ctypes
-import logging
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
+from functools import partial
+import itertools
+import logging
+import time
+from typing import Any
 
 from pymodbus.client import AsyncModbusTcpClient, AsyncModbusUdpClient
 from pymodbus.framer import FramerType
@@ -14,38 +21,103 @@ from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .capture import NO_RESPONSE, TrafficRecorder
 from .const import (
+    CONF_DEVICE_PROFILE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_NATIVE_TRANSPORT,
     CONF_PROTOCOL,
     CONF_REGISTERS,
     CONF_SLAVE_ID,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_PROTOCOL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    INTERVAL_BACKOFF,
+    INTERVAL_SPEEDUP,
+    MODBUS_MAX_READ_REGISTERS,
+    NOISE_BAND,
+    RATE_ACTIVE,
+    RATE_IDLE,
     PROTOCOL_TCP,
     PROTOCOL_UDP,
+    SENSOR_DESCRIPTIONS,
+    SHUTDOWN_TIMEOUT,
+    TIMED_MODE_SWITCHES,
     RegisterDataType,
     get_default_registers,
 )
+from .probe import ILLEGAL_FUNCTION, WanasDeviceProfile, async_probe_device
+from .sampling import HighRateSampler
+from .snapshot import RegisterSnapshot, SnapshotLayout
+from .transport import NativeModbusClient
 
 _LOGGER = logging.getLogger(__name__)
 
+type ModbusClient = AsyncModbusTcpClient | AsyncModbusUdpClient | NativeModbusClient
+
+# Request queue priorities, lower is served first
+PRIORITY_WRITE = 0
+PRIORITY_POLL = 1
+
+WRITE_LATENCY_SAMPLES = 20
+
+
+@dataclass(order=True)
+class _QueuedRequest:
+    """A Modbus transaction waiting for the shared client."""
+
+    priority: int
+    sequence: int
+    call: Callable[[ModbusClient], Awaitable[Any]] = field(
+        compare=False
+    )
+    future: asyncio.Future[Any] = field(compare=False)
 
-def _build_read_blocks(addresses: list[int], max_gap: int = 3) -> list[tuple[int, int]]:
+
+def _discard_futures(futures: list[asyncio.Future[Any]]) -> None:
+    """Cancel unfinished futures and retrieve errors of finished ones."""
+    for future in futures:
+        if not future.done():
+            future.cancel()
+        elif not future.cancelled():
+            future.exception()
+
+
+def _build_read_blocks(
+    addresses: list[int],
+    max_gap: int = 3,
+    max_count: int = MODBUS_MAX_READ_REGISTERS,
+    illegal: tuple[int, ...] = (),
+) -> list[tuple[int, int]]:
     """Group sorted addresses into contiguous read blocks.
 
     Returns list of (start_address, count) tuples.
-    Addresses within max_gap of each other are merged into one block.
+    Addresses within max_gap of each other are merged into one block, as
+    long as the block stays within max_count registers and does not span
+    an address the device rejects. Addresses outside the 16-bit register
+    space are ignored and max_count is clamped to the protocol limit.
     """
-    if not addresses:
+    max_count = min(max(max_count, 1), MODBUS_MAX_READ_REGISTERS)
+    illegal_set = set(illegal)
+    sorted_addrs = sorted(
+        addr for addr in set(addresses) - illegal_set if 0 <= addr <= 0xFFFF
+    )
+    if not sorted_addrs:
         return []
 
-    sorted_addrs = sorted(set(addresses))
     blocks: list[tuple[int, int]] = []
     block_start = sorted_addrs[0]
     block_end = sorted_addrs[0]
 
     for addr in sorted_addrs[1:]:
-        if addr - block_end <= max_gap:
+        if (
+            addr - block_end <= max_gap
+            and addr - block_start < max_count
+            and illegal_set.isdisjoint(range(block_end + 1, addr))
+        ):
             block_end = addr
         else:
             blocks.append((block_start, block_end - block_start + 1))
@@ -56,13 +128,22 @@ def _build_read_blocks(addresses: list[int], max_gap: int = 3) -> list[tuple[int
     return blocks
 
 
-class WanasCoordinator(DataUpdateCoordinator[dict[int, int]]):
+class WanasCoordinator(DataUpdateCoordinator[RegisterSnapshot]):
     """Coordinator to manage Modbus data fetching for Wanas."""
 
     config_entry: ConfigEntry
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        """Initialize the coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        client_factory: Callable[[], ModbusClient] | None = None,
+    ) -> None:
+        """Initialize the coordinator.
+
+        client_factory replaces the Modbus client the coordinator creates
+        and reconnects, e.g. with a ReplayClient for offline replay.
+        """
         super().__init__(
             hass,
             _LOGGER,
@@ -73,7 +154,14 @@ class WanasCoordinator(DataUpdateCoordinator[dict[int, int]]):
         self.port: int = entry.data[CONF_PORT]
         self.slave_id: int = entry.data[CONF_SLAVE_ID]
         self.protocol: str = entry.data.get(CONF_PROTOCOL, DEFAULT_PROTOCOL)
-        self._client: AsyncModbusTcpClient | AsyncModbusUdpClient | None = None
+        self.native_transport: bool = entry.options.get(CONF_NATIVE_TRANSPORT, False)
+        self._client_factory = client_factory
+        # Reuse the connection left open by the config flow probe, if any
+        self._client: ModbusClient | None = (
+            None
+            if client_factory is not None
+            else hass.data.get(DOMAIN, {}).pop(entry.unique_id, None)
+        )
 
         # Build effective register map: defaults overridden by user options
         defaults = get_default_registers()
@@ -81,28 +169,82 @@ class WanasCoordinator(DataUpdateCoordinator[dict[int, int]]):
         self.registers: dict[str, int | str] = {**defaults, **overrides}
 
         # Pre-compute read blocks from address keys only (skip *_name keys)
-        all_addresses = [
+        self._addresses = [
             v for k, v in self.registers.items()
             if k.endswith("_address") and isinstance(v, int)
         ]
-        self._read_blocks = _build_read_blocks(all_addresses)
+        self._apply_profile(
+            WanasDeviceProfile.from_dict(entry.data.get(CONF_DEVICE_PROFILE))
+        )
+        self.capture = TrafficRecorder()
 
-    def _create_client(self) -> AsyncModbusTcpClient | AsyncModbusUdpClient:
+        self._queue: asyncio.PriorityQueue[_QueuedRequest] = asyncio.PriorityQueue()
+        self._worker: asyncio.Task[None] | None = None
+        self._submitted = itertools.count()
+        self._executed = itertools.count()
+        # Verify reads done by writes: address -> (execution sequence, value)
+        self._verified: dict[int, tuple[int, int]] = {}
+        self._closing = False
+        self.write_latencies: deque[float] = deque(maxlen=WRITE_LATENCY_SAMPLES)
+        self.sampler = HighRateSampler(self)
+
+        # Adaptive polling bounds and the registers it watches
+        self.min_interval: int = entry.options.get(
+            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+        )
+        self.max_interval: int = entry.options.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        )
+        self._watched: list[tuple[int, RegisterDataType]] = [
+            (self.registers.get(f"{desc.key}_address", desc.address), desc.data_type)
+            for desc in SENSOR_DESCRIPTIONS
+        ]
+        self._timed_modes: list[int] = [
+            self.registers[f"{key}_verify_address"] for key in TIMED_MODE_SWITCHES
+        ]
+        self._last_poll: tuple[float, RegisterSnapshot] | None = None
+
+    def _apply_profile(self, profile: WanasDeviceProfile) -> None:
+        """Derive read plan and request timeout from a device profile."""
+        self.profile = profile
+        self._read_blocks = self.plan_read_blocks(self._addresses)
+        self._layout = SnapshotLayout(self._read_blocks)
+        self._timeout = profile.timeout
+
+    def plan_read_blocks(self, addresses: list[int]) -> list[tuple[int, int]]:
+        """Plan read blocks for addresses within the device profile limits."""
+        return _build_read_blocks(
+            addresses,
+            max_count=self.profile.max_registers,
+            illegal=self.profile.illegal_addresses,
+        )
+
+    def _create_client(self) -> ModbusClient:
         """Create a Modbus client based on protocol selection."""
+        if self._client_factory is not None:
+            return self._client_factory()
+        if self.native_transport:
+            return NativeModbusClient(self.host, self.port, self.protocol, self._timeout)
         if self.protocol == PROTOCOL_UDP:
             return AsyncModbusUdpClient(
-                host=self.host, port=self.port, framer=FramerType.SOCKET
+                host=self.host,
+                port=self.port,
+                framer=FramerType.SOCKET,
+                timeout=self._timeout,
             )
         if self.protocol == PROTOCOL_TCP:
             return AsyncModbusTcpClient(
-                host=self.host, port=self.port, framer=FramerType.SOCKET
+                host=self.host,
+                port=self.port,
+                framer=FramerType.SOCKET,
+                timeout=self._timeout,
             )
         # RTU over TCP
         return AsyncModbusTcpClient(
-            host=self.host, port=self.port, framer=FramerType.RTU
+            host=self.host, port=self.port, framer=FramerType.RTU, timeout=self._timeout
         )
 
-    async def _get_client(self) -> AsyncModbusTcpClient | AsyncModbusUdpClient:
+    async def _get_client(self) -> ModbusClient:
         """Get or create the Modbus client."""
         if self._client is None or not self._client.connected:
             self._client = self._create_client()
@@ -113,12 +255,146 @@ class WanasCoordinator(DataUpdateCoordinator[dict[int, int]]):
                 )
         return self._client
 
+    def _async_submit(
+        self,
+        priority: int,
+        call: Callable[[ModbusClient], Awaitable[Any]],
+    ) -> asyncio.Future[Any]:
+        """Queue a Modbus transaction and return a future for its result.
+
+        Lower priority values are served first; requests of equal priority
+        keep submission order.
+        """
+        if self._closing:
+            raise UpdateFailed("Modbus connection is closed")
+        if self._worker is None or self._worker.done():
+            self._worker = self.hass.async_create_background_task(
+                self._async_process_queue(), f"{DOMAIN} request queue"
+            )
+        future: asyncio.Future[Any] = self.hass.loop.create_future()
+        self._queue.put_nowait(
+            _QueuedRequest(priority, next(self._submitted), call, future)
+        )
+        return future
+
+    async def _async_process_queue(self) -> None:
+        """Execute queued transactions one at a time on the shared client."""
+        while True:
+            request = await self._queue.get()
+            if request.future.done():
+                # Cancelled while waiting in the queue
+                continue
+            try:
+                client = await self._get_client()
+                result = await request.call(client)
+            except asyncio.CancelledError:
+                request.future.cancel()
+                raise
+            except UpdateFailed as err:
+                if not request.future.done():
+                    request.future.set_exception(err)
+            except Exception as err:  # noqa: BLE001
+                # Drop the connection so a desynced stream is not reused
+                if self._client is not None:
+                    self._client.close()
+                    self._client = None
+                if not request.future.done():
+                    request.future.set_exception(err)
+            else:
+                if not request.future.done():
+                    request.future.set_result(result)
+
+    async def _async_wait(self, awaitable: Awaitable[Any]) -> Any:
+        """Await queued work, reporting cancellation by shutdown as a failure."""
+        try:
+            return await awaitable
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise
+            raise UpdateFailed("Request cancelled, connection is closing") from None
+
+    async def async_probe(self) -> WanasDeviceProfile:
+        """Probe device capabilities and apply them to the read plan.
+
+        The connection used for probing stays open for the first refresh.
+        """
+        try:
+            profile = await self._async_wait(
+                self._async_submit(
+                    PRIORITY_POLL,
+                    partial(
+                        async_probe_device,
+                        device_id=self.slave_id,
+                        blocks=_build_read_blocks(self._addresses),
+                        execute=self._async_execute,
+                    ),
+                )
+            )
+        except UpdateFailed:
+            raise
+        except Exception as err:
+            raise UpdateFailed(f"Error probing device: {err}") from err
+
+        self._apply_profile(profile)
+        return profile
+
+    async def _async_execute(
+        self,
+        function_code: int,
+        address: int,
+        count: int,
+        request: Awaitable[Any],
+        values: Sequence[int] | None = None,
+    ) -> Any:
+        """Await a Modbus request and record the exchange in the capture.
+
+        For writes, values are recorded as payload; for reads the response
+        registers are. The request, including any client retries, is bounded
+        by the timeout of the device profile. This also covers a client
+        handed over by the config flow, which was created before the round
+        trip was known.
+        """
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(self._timeout):
+                result = await request
+        except Exception:
+            self.capture.record(
+                function_code, address, count, (), time.monotonic() - started, NO_RESPONSE
+            )
+            raise
+        latency = time.monotonic() - started
+        if result.isError():
+            self.capture.record(
+                function_code,
+                address,
+                count,
+                (),
+                latency,
+                getattr(result, "exception_code", 0) or NO_RESPONSE,
+            )
+        else:
+            self.capture.record(
+                function_code,
+                address,
+                count,
+                result.registers if values is None else values,
+                latency,
+            )
+        return result
+
     async def _read_registers(
-        self, client: AsyncModbusTcpClient | AsyncModbusUdpClient, address: int, count: int
+        self, client: ModbusClient, address: int, count: int
     ) -> list[int]:
         """Read holding registers and return values."""
-        result = await client.read_holding_registers(
-            address=address, count=count, device_id=self.slave_id
+        result = await self._async_execute(
+            3,
+            address,
+            count,
+            client.read_holding_registers(
+                address=address, count=count, device_id=self.slave_id
+            ),
         )
         if result.isError():
             raise UpdateFailed(
@@ -126,65 +402,284 @@ class WanasCoordinator(DataUpdateCoordinator[dict[int, int]]):
             )
         return result.registers
 
-    async def _async_update_data(self) -> dict[int, int]:
-        """Fetch data from Modbus device."""
+    async def _async_read_block(
+        self, client: ModbusClient, address: int, count: int
+    ) -> tuple[int, list[int]]:
+        """Read a block and return it with its execution sequence number."""
+        sequence = next(self._executed)
+        return sequence, await self._read_registers(client, address, count)
+
+    def _verify_block(self, verify_address: int) -> tuple[int, int]:
+        """Return the poll block holding a verify register, or the register alone."""
+        for start, count in self._read_blocks:
+            if start <= verify_address < start + count:
+                return start, count
+        return verify_address, 1
+
+    async def _async_write_read_combined(
+        self,
+        client: ModbusClient,
+        address: int,
+        value: int,
+        verify_address: int,
+    ) -> tuple[int, int, list[int]] | None:
+        """Write a register and read its state block with a single FC23 request.
+
+        Returns None if the device turns out not to support FC23, in which
+        case nothing was written.
+        """
+        start, count = self._verify_block(verify_address)
+        sequence = next(self._executed)
+        result = await self._async_execute(
+            23,
+            start,
+            count,
+            client.readwrite_registers(
+                read_address=start,
+                read_count=count,
+                write_address=address,
+                values=[value],
+                device_id=self.slave_id,
+            ),
+        )
+        if result.isError():
+            if getattr(result, "exception_code", None) == ILLEGAL_FUNCTION:
+                _LOGGER.debug("Device rejected FC23, falling back to FC6")
+                self.profile = replace(self.profile, supports_fc23=False)
+                return None
+            raise UpdateFailed(
+                f"Error writing register {address}: {result}"
+            )
+        return sequence, start, result.registers
+
+    async def _async_write_and_verify(
+        self,
+        client: ModbusClient,
+        address: int,
+        value: int,
+        verify_address: int | None,
+    ) -> tuple[int, int, list[int]] | None:
+        """Write a register and read back its verify register in one job.
+
+        Uses a combined FC23 round trip when the device supports it.
+        Returns (sequence, start address, registers) of the read back.
+        """
+        if verify_address is not None and self.profile.supports_fc23:
+            combined = await self._async_write_read_combined(
+                client, address, value, verify_address
+            )
+            if combined is not None:
+                return combined
+
+        result = await self._async_execute(
+            6,
+            address,
+            1,
+            client.write_register(
+                address=address, value=value, device_id=self.slave_id
+            ),
+            values=(value,),
+        )
+        if result.isError():
+            raise UpdateFailed(
+                f"Error writing register {address}: {result}"
+            )
+        if verify_address is None:
+            return None
+        sequence, regs = await self._async_read_block(client, verify_address, 1)
+        return sequence, verify_address, regs
+
+    async def _async_gather_blocks(
+        self, blocks: list[tuple[int, int]]
+    ) -> list[tuple[int, list[int]]]:
+        """Queue all blocks at once and wait for their results.
+
+        Writes submitted meanwhile are served before the remaining blocks,
+        after which the blocks continue where they left off.
+        """
+        futures = [
+            self._async_submit(
+                PRIORITY_POLL,
+                partial(self._async_read_block, address=start, count=count),
+            )
+            for start, count in blocks
+        ]
         try:
-            client = await self._get_client()
-        except Exception as err:
-            self._client = None
-            raise UpdateFailed(f"Connection error: {err}") from err
+            return await self._async_wait(asyncio.gather(*futures))
+        finally:
+            _discard_futures(futures)
 
+    async def async_read_blocks(self, blocks: list[tuple[int, int]]) -> dict[int, int]:
+        """Read blocks outside the poll cycle without touching coordinator data."""
         data: dict[int, int] = {}
+        for (start, _count), (_sequence, regs) in zip(
+            blocks, await self._async_gather_blocks(blocks)
+        ):
+            for i, val in enumerate(regs):
+                data[start + i] = val
+        return data
+
+    def _adapt_interval(self, data: RegisterSnapshot, now: float) -> None:
+        """Adjust the poll interval to how fast the unit is changing.
 
+        A running timed mode polls at the floor. Otherwise the largest change
+        of a watched value since the previous poll is divided by the time
+        between the polls, so the decision does not depend on the interval
+        it produced. The interval is shortened while that rate is above
+        RATE_ACTIVE and the change would stay clear of the noise band at the
+        shorter interval, lengthened while the change is inside the noise
+        band or the rate is below RATE_IDLE, and held in between, always
+        within the configured floor and ceiling.
+        """
+        previous, self._last_poll = self._last_poll, (now, data)
+        current = self.update_interval.total_seconds()
+        if any(data.get(address) for address in self._timed_modes):
+            interval = self.min_interval
+        elif previous is None or now <= previous[0]:
+            return
+        else:
+            elapsed = now - previous[0]
+            change = 0.0
+            for address, data_type in self._watched:
+                new = self.get_sensor_value(data, address, data_type, None)
+                old = self.get_sensor_value(previous[1], address, data_type, None)
+                if new is not None and old is not None:
+                    change = max(change, abs(new - old))
+            rate = change / elapsed
+            # A margin of one band keeps quantisation from undoing a speedup
+            if rate > RATE_ACTIVE and change * INTERVAL_SPEEDUP > 2 * NOISE_BAND:
+                factor = INTERVAL_SPEEDUP
+            elif change <= NOISE_BAND or rate < RATE_IDLE:
+                factor = INTERVAL_BACKOFF
+            else:
+                return
+            interval = min(
+                max(round(current * factor), self.min_interval), self.max_interval
+            )
+
+        if interval != current:
+            _LOGGER.debug("Poll interval changed from %s s to %s s", current, interval)
+            self.update_interval = timedelta(seconds=interval)
+
+    async def _async_update_data(self) -> RegisterSnapshot:
+        """Fetch data from Modbus device."""
+        layout = self._layout
+        blocks = layout.blocks
         try:
-            for start, count in self._read_blocks:
-                regs = await self._read_registers(client, start, count)
-                for i, val in enumerate(regs):
-                    data[start + i] = val
+            results = await self._async_gather_blocks(blocks)
         except UpdateFailed:
             raise
         except Exception as err:
-            self._client = None
             raise UpdateFailed(f"Error fetching data: {err}") from err
 
+        data = layout.snapshot([regs for _sequence, regs in results])
+        newer: dict[int, int] = {}
+        for (start, count), (sequence, _regs) in zip(blocks, results):
+            # A verify read done after this block was polled is newer
+            for address, verified in self._verified.items():
+                if start <= address < start + count and verified[0] > sequence:
+                    newer[address] = verified[1]
+        if newer:
+            data = data.with_updates(newer)
+
+        last = max((sequence for sequence, _regs in results), default=-1)
+        self._verified = {
+            address: verified
+            for address, verified in self._verified.items()
+            if verified[0] > last
+        }
+        self._adapt_interval(data, time.monotonic())
         return data
 
-    async def async_write_register(self, address: int, value: int) -> None:
-        """Write a value to a holding register."""
+    async def async_write_register(
+        self, address: int, value: int, verify_address: int | None = None
+    ) -> None:
+        """Write a value to a holding register.
+
+        The write and the read of verify_address jump ahead of queued poll
+        blocks; with FC23 the whole poll block holding verify_address is
+        read back. Without a verify address a full refresh is requested.
+        """
+        started = time.monotonic()
         try:
-            client = await self._get_client()
-            result = await client.write_register(
-                address=address, value=value, device_id=self.slave_id
-            )
-            if result.isError():
-                raise UpdateFailed(
-                    f"Error writing register {address}: {result}"
+            verified = await self._async_wait(
+                self._async_submit(
+                    PRIORITY_WRITE,
+                    partial(
+                        self._async_write_and_verify,
+                        address=address,
+                        value=value,
+                        verify_address=verify_address,
+                    ),
                 )
-            # Refresh data after write
-            await self.async_request_refresh()
+            )
         except UpdateFailed:
             raise
         except Exception as err:
-            self._client = None
             raise UpdateFailed(f"Error writing register: {err}") from err
 
+        if verified is None:
+            # Refresh data after write
+            await self.async_request_refresh()
+            return
+
+        sequence, start, regs = verified
+        block = {start + i: val for i, val in enumerate(regs)}
+        for block_address, val in block.items():
+            self._verified[block_address] = (sequence, val)
+        latency = time.monotonic() - started
+        self.write_latencies.append(latency)
+        _LOGGER.debug(
+            "Write of %s to register %s confirmed in %.3f s", value, address, latency
+        )
+        if self.data is not None:
+            self.async_set_updated_data(self.data.with_updates(block))
+
     async def async_close(self) -> None:
-        """Close the Modbus client connection."""
-        if self._client and self._client.connected:
+        """Cancel pending work and close the Modbus client connection.
+
+        Queued and in-flight transactions are cancelled rather than drained,
+        and waiting for the worker is bounded by SHUTDOWN_TIMEOUT, so a
+        stalled device cannot hold up unload. The client is closed even if
+        its connect is still pending.
+        """
+        self._closing = True
+        self.sampler.async_stop()
+        await self.async_shutdown()
+        while not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.wait({self._worker}, timeout=SHUTDOWN_TIMEOUT)
+            self._worker = None
+        if self._client is not None:
             self._client.close()
             self._client = None
 
     @staticmethod
     def get_sensor_value(
-        data: dict[int, int], address: int, data_type: RegisterDataType, scale: float | None
+        data: Mapping[int, int],
+        address: int,
+        data_type: RegisterDataType,
+        scale: float | None,
     ) -> float | int | None:
         """Parse a register value with type and scale handling."""
-        raw = data.get(address)
+        return WanasCoordinator.decode_sensor_value(
+            data.get(address), data_type, scale
+        )
+
+    @staticmethod
+    def decode_sensor_value(
+        raw: int | None,
+        data_type: RegisterDataType,
+        scale: float | None,
+    ) -> float | int | None:
+        """Parse a raw register value with type and scale handling."""
         if raw is None:
             return None
 
         if data_type == RegisterDataType.INT16:
-            raw = ctypes.c_int16(raw).value
+            raw = raw - 0x10000 if raw & 0x8000 else raw
 
         if scale is not None:
             return round(raw * scale, 1)
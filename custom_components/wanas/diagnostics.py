@@ -0,0 +1,42 @@
+"""Diagnostics support for Wanas integration."""
+
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from . import WanasConfigEntry
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: WanasConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    The traffic capture is included as base64 so it can be fed back into
+    ReplayClient.from_diagnostics.
+    """
+    coordinator = entry.runtime_data
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "data": {
+            "profile": coordinator.profile.as_dict(),
+            "read_blocks": coordinator._read_blocks,
+            "registers": dict(coordinator.data) if coordinator.data else None,
+            "write_latencies": list(coordinator.write_latencies),
+            "capture": {
+                "frame_count": len(coordinator.capture),
+                "capacity": coordinator.capture.capacity,
+                "frames": base64.b64encode(coordinator.capture.export()).decode(),
+            },
+        },
+    }
@@ -0,0 +1,254 @@
+"""Device capability probing for Wanas integration."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+import logging
+import statistics
+import time
+from typing import Any
+
+from pymodbus.client import AsyncModbusTcpClient, AsyncModbusUdpClient
+
+from .const import (
+    DEFAULT_TIMEOUT,
+    MAX_TIMEOUT,
+    MIN_TIMEOUT,
+    MODBUS_MAX_READ_REGISTERS,
+    RTT_TIMEOUT_FACTOR,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Awaits a request given as (function code, address, count, request), e.g.
+# to record it in the traffic capture
+type ProbeExecute = Callable[[int, int, int, Awaitable[Any]], Awaitable[Any]]
+
+# Modbus exception codes
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_DATA_ADDRESS = 0x02
+
+# Block sizes tried when looking for the per-request register limit
+PROBE_BLOCK_SIZES = (MODBUS_MAX_READ_REGISTERS, 100, 64, 32, 16, 8)
+PROBE_RTT_SAMPLES = 3
+
+
+@dataclass(frozen=True)
+class WanasDeviceProfile:
+    """Transport capabilities detected on a Wanas device."""
+
+    max_registers: int = MODBUS_MAX_READ_REGISTERS
+    supports_fc23: bool = False
+    illegal_addresses: tuple[int, ...] = ()
+    rtt: float | None = None
+
+    @property
+    def timeout(self) -> float:
+        """Return the request timeout derived from the measured round trip."""
+        if self.rtt is None:
+            return DEFAULT_TIMEOUT
+        return min(max(self.rtt * RTT_TIMEOUT_FACTOR, MIN_TIMEOUT), MAX_TIMEOUT)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation for the config entry."""
+        data = asdict(self)
+        data["illegal_addresses"] = list(self.illegal_addresses)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> WanasDeviceProfile:
+        """Build a profile from stored config entry data."""
+        if not data:
+            return cls()
+        return cls(
+            max_registers=int(data.get("max_registers", MODBUS_MAX_READ_REGISTERS)),
+            supports_fc23=bool(data.get("supports_fc23", False)),
+            illegal_addresses=tuple(data.get("illegal_addresses", ())),
+            rtt=data.get("rtt"),
+        )
+
+
+async def _async_execute(
+    function_code: int, address: int, count: int, request: Awaitable[Any]
+) -> Any:
+    """Await a probe request without recording it."""
+    return await request
+
+
+def _exception_code(result: Any) -> int | None:
+    """Return the Modbus exception code of an error response, if any."""
+    return getattr(result, "exception_code", None)
+
+
+async def _async_probe_max_registers(
+    client: AsyncModbusTcpClient | AsyncModbusUdpClient,
+    device_id: int,
+    start: int,
+    execute: ProbeExecute,
+) -> int:
+    """Find the largest register count the device accepts in one request.
+
+    Per the Modbus spec the quantity is validated before the address range,
+    so an illegal address response still means the count was accepted.
+    """
+    for count in PROBE_BLOCK_SIZES:
+        try:
+            result = await execute(
+                3,
+                start,
+                count,
+                client.read_holding_registers(
+                    address=start, count=count, device_id=device_id
+                ),
+            )
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("No response reading %s registers at %s", count, start)
+            continue
+        if not result.isError() or _exception_code(result) == ILLEGAL_DATA_ADDRESS:
+            return count
+    return PROBE_BLOCK_SIZES[-1]
+
+
+async def _async_probe_illegal_addresses(
+    client: AsyncModbusTcpClient | AsyncModbusUdpClient,
+    device_id: int,
+    blocks: list[tuple[int, int]],
+    execute: ProbeExecute,
+) -> tuple[int, ...]:
+    """Find addresses inside the planned read blocks the device rejects."""
+    illegal: list[int] = []
+    for start, count in blocks:
+        result = await execute(
+            3,
+            start,
+            count,
+            client.read_holding_registers(
+                address=start, count=count, device_id=device_id
+            ),
+        )
+        if not result.isError():
+            continue
+        if _exception_code(result) != ILLEGAL_DATA_ADDRESS:
+            continue
+        for address in range(start, start + count):
+            single = await execute(
+                3,
+                address,
+                1,
+                client.read_holding_registers(
+                    address=address, count=1, device_id=device_id
+                ),
+            )
+            if single.isError() and _exception_code(single) == ILLEGAL_DATA_ADDRESS:
+                illegal.append(address)
+    return tuple(illegal)
+
+
+async def _async_probe_rtt(
+    client: AsyncModbusTcpClient | AsyncModbusUdpClient,
+    device_id: int,
+    address: int,
+    execute: ProbeExecute,
+) -> float | None:
+    """Measure the median round trip time of a single register read."""
+    samples: list[float] = []
+    for _ in range(PROBE_RTT_SAMPLES):
+        started = time.monotonic()
+        result = await execute(
+            3,
+            address,
+            1,
+            client.read_holding_registers(
+                address=address, count=1, device_id=device_id
+            ),
+        )
+        if result.isError():
+            continue
+        samples.append(time.monotonic() - started)
+    if not samples:
+        return None
+    return statistics.median(samples)
+
+
+async def _async_probe_fc23(
+    client: AsyncModbusTcpClient | AsyncModbusUdpClient,
+    device_id: int,
+    address: int,
+    execute: ProbeExecute,
+) -> bool:
+    """Check whether the device implements Read/Write Multiple Registers.
+
+    The register is read first and the same value is written back, so the
+    probe leaves the device state unchanged. A device without FC23 answers
+    with an illegal function exception; any other answer, including a
+    rejected write, means the function code is known.
+    """
+    try:
+        current = await execute(
+            3,
+            address,
+            1,
+            client.read_holding_registers(
+                address=address, count=1, device_id=device_id
+            ),
+        )
+        if current.isError():
+            return False
+        result = await execute(
+            23,
+            address,
+            1,
+            client.readwrite_registers(
+                read_address=address,
+                read_count=1,
+                write_address=address,
+                values=current.registers[:1],
+                device_id=device_id,
+            ),
+        )
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("No response probing function code 23")
+        return False
+    if not result.isError():
+        return True
+    return _exception_code(result) != ILLEGAL_FUNCTION
+
+
+async def async_probe_device(
+    client: AsyncModbusTcpClient | AsyncModbusUdpClient,
+    device_id: int,
+    blocks: list[tuple[int, int]],
+    execute: ProbeExecute = _async_execute,
+) -> WanasDeviceProfile:
+    """Probe a connected device and return its transport profile.
+
+    The client must already be connected. Raises on transport errors while
+    reading the planned blocks, so callers can treat it as a connection test.
+    Every request is awaited through execute, which lets the coordinator
+    record probe traffic in its capture.
+    """
+    illegal = await _async_probe_illegal_addresses(client, device_id, blocks, execute)
+    first = next(
+        (
+            address
+            for start, count in blocks
+            for address in range(start, start + count)
+            if address not in illegal
+        ),
+        0,
+    )
+    rtt = await _async_probe_rtt(client, device_id, first, execute)
+    if rtt is None:
+        raise ConnectionError(f"Device {device_id} did not answer register {first}")
+
+    profile = WanasDeviceProfile(
+        max_registers=await _async_probe_max_registers(
+            client, device_id, first, execute
+        ),
+        supports_fc23=await _async_probe_fc23(client, device_id, first, execute),
+        illegal_addresses=illegal,
+        rtt=rtt,
+    )
+    _LOGGER.debug("Probed device %s: %s", device_id, profile)
+    return profile
@@ -0,0 +1,150 @@
+"""Offline replay of captured Modbus traffic for Wanas integration."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import statistics
+from typing import Any
+
+from pymodbus.exceptions import ModbusIOException
+
+from .capture import NO_RESPONSE, CapturedFrame, load_capture
+
+# How many captured frames ahead a diverging request may resync to
+REPLAY_LOOKAHEAD = 64
+
+
+@dataclass
+class ReplayResponse:
+    """Minimal stand-in for a pymodbus response."""
+
+    function_code: int
+    registers: list[int] = field(default_factory=list)
+    exception_code: int = 0
+
+    def isError(self) -> bool:  # noqa: N802
+        """Return true for exception responses, like pymodbus does."""
+        return self.exception_code != 0
+
+
+class ReplayClient:
+    """Fake Modbus device that plays back a captured trace.
+
+    Requests matching the next captured frame consume it and are answered
+    with the recorded payload, error and latency. A request that matches a
+    frame further ahead, within REPLAY_LOOKAHEAD frames, resyncs the replay
+    there; the frames in between are skipped but still update the register
+    image. Requests that match nothing, e.g. after a change to the read
+    plan, are served from the register image built up so far, using the
+    median recorded latency.
+    """
+
+    def __init__(self, frames: Sequence[CapturedFrame], speed: float = 1.0) -> None:
+        """Initialize the replay client."""
+        self._frames = list(frames)
+        self._position = 0
+        self._speed = speed
+        self._image: dict[int, int] = {}
+        latencies = [f.latency for f in self._frames if f.exception_code != NO_RESPONSE]
+        self._default_latency = statistics.median(latencies) if latencies else 0.0
+        self.connected = False
+        self.requests = 0
+        self.unmatched = 0
+        self.skipped = 0
+
+    @classmethod
+    def from_capture(cls, data: bytes, speed: float = 1.0) -> ReplayClient:
+        """Create a replay client from an exported capture."""
+        return cls(load_capture(data), speed)
+
+    @classmethod
+    def from_diagnostics(cls, diagnostics: dict[str, Any], speed: float = 1.0) -> ReplayClient:
+        """Create a replay client from a downloaded diagnostics dump."""
+        if "home_assistant" in diagnostics:
+            diagnostics = diagnostics["data"]
+        capture = diagnostics["data"]["capture"]["frames"]
+        return cls.from_capture(base64.b64decode(capture), speed)
+
+    @property
+    def finished(self) -> bool:
+        """Return true once every captured frame has been replayed."""
+        return self._position >= len(self._frames)
+
+    async def connect(self) -> bool:
+        """Pretend to connect."""
+        self.connected = True
+        return True
+
+    def close(self) -> None:
+        """Pretend to disconnect."""
+        self.connected = False
+
+    def _apply(self, frame: CapturedFrame) -> None:
+        """Update the register image with a replayed frame."""
+        if frame.is_error:
+            return
+        for i, value in enumerate(frame.payload):
+            self._image[frame.address + i] = value
+
+    async def _async_answer(
+        self, function_code: int, address: int, count: int
+    ) -> ReplayResponse:
+        """Answer a request from the trace or the register image."""
+        self.requests += 1
+        key = (function_code, address, count)
+        end = min(self._position + REPLAY_LOOKAHEAD, len(self._frames))
+        for index in range(self._position, end):
+            if (frame := self._frames[index]).key == key:
+                break
+        else:
+            frame = None
+        if frame is not None:
+            for skipped in self._frames[self._position : index]:
+                self._apply(skipped)
+            self.skipped += index - self._position
+            self._position = index + 1
+            await asyncio.sleep(frame.latency / self._speed)
+            self._apply(frame)
+            if frame.exception_code == NO_RESPONSE:
+                raise ModbusIOException("No response received (replayed)")
+            return ReplayResponse(
+                function_code, list(frame.payload), frame.exception_code
+            )
+
+        self.unmatched += 1
+        await asyncio.sleep(self._default_latency / self._speed)
+        return ReplayResponse(
+            function_code, [self._image.get(address + i, 0) for i in range(count)]
+        )
+
+    async def read_holding_registers(
+        self, address: int, *, count: int = 1, device_id: int = 1
+    ) -> ReplayResponse:
+        """Replay a Read Holding Registers request."""
+        return await self._async_answer(3, address, count)
+
+    async def write_register(
+        self, address: int, value: int, *, device_id: int = 1
+    ) -> ReplayResponse:
+        """Replay a Write Single Register request."""
+        self._image[address] = value
+        response = await self._async_answer(6, address, 1)
+        response.registers = []
+        return response
+
+    async def readwrite_registers(
+        self,
+        *,
+        read_address: int = 0,
+        read_count: int = 0,
+        write_address: int = 0,
+        values: Sequence[int] = (),
+        device_id: int = 1,
+    ) -> ReplayResponse:
+        """Replay a Read/Write Multiple Registers request."""
+        for i, value in enumerate(values):
+            self._image[write_address + i] = value
+        return await self._async_answer(23, read_address, read_count)
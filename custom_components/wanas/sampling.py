@@ -0,0 +1,193 @@
+"""High-rate sampling with long-term statistics export for Wanas integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN, SENSOR_DESCRIPTIONS, WanasSensorDescription
+
+if TYPE_CHECKING:
+    from .coordinator import WanasCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of samples collected before aggregates are pushed to the recorder
+STATISTICS_FLUSH_SAMPLES = 60
+
+
+@dataclass
+class _Bucket:
+    """Running aggregate of one statistic for one hour."""
+
+    minimum: float
+    maximum: float
+    total: float
+    count: int = 1
+
+    def add(self, value: float) -> None:
+        """Add a sample to the aggregate."""
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.total += value
+        self.count += 1
+
+
+class HighRateSampler:
+    """Temporarily poll selected registers at a high rate.
+
+    Samples never reach the coordinator data, so entity states keep the
+    normal polling rate. They are aggregated into hourly buckets which are
+    written as external statistics in batches; a bucket is rewritten with
+    its updated aggregate until its hour has passed. Buckets are kept
+    across runs, so restarting sampling within an hour extends that hour's
+    aggregate instead of overwriting it.
+    """
+
+    def __init__(self, coordinator: WanasCoordinator) -> None:
+        """Initialize the sampler."""
+        self._coordinator = coordinator
+        self._task: asyncio.Task[None] | None = None
+        self._buckets: dict[str, dict[datetime, _Bucket]] = {}
+        self._metadata: dict[str, StatisticMetaData] = {}
+        self.ends_at: datetime | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return true while a sampling run is in progress."""
+        return self._task is not None and not self._task.done()
+
+    def _statistic_id(self, description: WanasSensorDescription) -> str:
+        """Return the external statistic id for a sensor."""
+        entry_id = slugify(self._coordinator.config_entry.entry_id)
+        return f"{DOMAIN}:{entry_id}_{description.key}_high_rate"
+
+    def sensors_for(
+        self, addresses: list[int]
+    ) -> dict[int, list[WanasSensorDescription]]:
+        """Return the sensors read from the given addresses, by address."""
+        registers = self._coordinator.registers
+        sensors: dict[int, list[WanasSensorDescription]] = {}
+        for desc in SENSOR_DESCRIPTIONS:
+            address = registers.get(f"{desc.key}_address", desc.address)
+            if address in addresses:
+                sensors.setdefault(address, []).append(desc)
+        return sensors
+
+    def async_start(
+        self, duration: timedelta, interval: timedelta, addresses: list[int]
+    ) -> None:
+        """Start sampling, replacing any run in progress."""
+        self.async_stop()
+
+        registers = self._coordinator.registers
+        sensors = self.sensors_for(addresses)
+        for descriptions in sensors.values():
+            for desc in descriptions:
+                statistic_id = self._statistic_id(desc)
+                self._metadata[statistic_id] = StatisticMetaData(
+                    mean_type=StatisticMeanType.ARITHMETIC,
+                    has_sum=False,
+                    name=f"{registers.get(f'{desc.key}_name', desc.name)} (high rate)",
+                    source=DOMAIN,
+                    statistic_id=statistic_id,
+                    unit_of_measurement=desc.unit,
+                )
+
+        self.ends_at = dt_util.utcnow() + duration
+        self._task = self._coordinator.hass.async_create_background_task(
+            self._async_run(duration, interval, sensors),
+            f"{DOMAIN} high-rate sampling",
+        )
+
+    def async_stop(self) -> None:
+        """Stop the current run; collected samples are flushed."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.ends_at = None
+
+    async def _async_run(
+        self,
+        duration: timedelta,
+        interval: timedelta,
+        sensors: dict[int, list[WanasSensorDescription]],
+    ) -> None:
+        """Sample until the duration has elapsed."""
+        coordinator = self._coordinator
+        blocks = coordinator.plan_read_blocks(list(sensors))
+        deadline = time.monotonic() + duration.total_seconds()
+        period = interval.total_seconds()
+        pending = 0
+        _LOGGER.debug("High-rate sampling of %s every %s s", blocks, period)
+
+        try:
+            while (started := time.monotonic()) < deadline:
+                try:
+                    data = await coordinator.async_read_blocks(blocks)
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.debug("High-rate sample failed: %s", err)
+                else:
+                    self._add_sample(data, sensors)
+                    pending += 1
+                    if pending >= STATISTICS_FLUSH_SAMPLES:
+                        self._flush()
+                        pending = 0
+                await asyncio.sleep(max(0.0, period - (time.monotonic() - started)))
+        finally:
+            self._flush()
+
+    def _add_sample(
+        self,
+        data: Mapping[int, int],
+        sensors: dict[int, list[WanasSensorDescription]],
+    ) -> None:
+        """Aggregate one sample into the current hourly buckets."""
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        for address, descriptions in sensors.items():
+            for desc in descriptions:
+                value = self._coordinator.get_sensor_value(
+                    data, address, desc.data_type, desc.scale
+                )
+                if value is None:
+                    continue
+                hourly = self._buckets.setdefault(self._statistic_id(desc), {})
+                if (bucket := hourly.get(hour)) is None:
+                    hourly[hour] = _Bucket(value, value, value)
+                else:
+                    bucket.add(value)
+
+    def _flush(self) -> None:
+        """Write aggregates to the recorder and drop completed hours."""
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        for statistic_id, hourly in self._buckets.items():
+            if not hourly:
+                continue
+            async_add_external_statistics(
+                self._coordinator.hass,
+                self._metadata[statistic_id],
+                [
+                    StatisticData(
+                        start=start,
+                        mean=bucket.total / bucket.count,
+                        min=bucket.minimum,
+                        max=bucket.maximum,
+                    )
+                    for start, bucket in sorted(hourly.items())
+                ],
+            )
+            for start in [start for start in hourly if start < hour]:
+                del hourly[start]
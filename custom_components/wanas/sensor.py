@@ -11,6 +11,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, SENSOR_DESCRIPTIONS, WanasSensorDescription
 from .coordinator import WanasCoordinator
+from .snapshot import RegisterRef
 
 
 async def async_setup_entry(
@@ -44,6 +45,10 @@ class WanasSensor(CoordinatorEntity[WanasCoordinator], SensorEntity):
         self._attr_name = coordinator.registers.get(
             f"{description.key}_name", description.name
         )
+        address = coordinator.registers.get(
+            f"{description.key}_address", description.address
+        )
+        self._register = RegisterRef(address)
         self._attr_native_unit_of_measurement = description.unit
         self._attr_device_class = description.device_class
         self._attr_state_class = description.state_class
@@ -58,12 +63,8 @@ class WanasSensor(CoordinatorEntity[WanasCoordinator], SensorEntity):
         """Return the sensor value."""
         if self.coordinator.data is None:
             return None
-        address = self.coordinator.registers.get(
-            f"{self._description.key}_address", self._description.address
-        )
-        return WanasCoordinator.get_sensor_value(
-            self.coordinator.data,
-            address,
+        return WanasCoordinator.decode_sensor_value(
+            self._register.get(self.coordinator.data),
             self._description.data_type,
             self._description.scale,
         )
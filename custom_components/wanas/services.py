@@ -0,0 +1,103 @@
+"""Services for Wanas integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import voluptuous as vol
+
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_ADDRESSES,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_INTERVAL,
+    DEFAULT_HIGH_RATE_ADDRESSES,
+    DEFAULT_HIGH_RATE_INTERVAL,
+    DOMAIN,
+    MAX_HIGH_RATE_DURATION,
+    MIN_HIGH_RATE_INTERVAL,
+    SERVICE_START_HIGH_RATE_SAMPLING,
+    SERVICE_STOP_HIGH_RATE_SAMPLING,
+)
+from .coordinator import WanasCoordinator
+
+START_HIGH_RATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_DURATION): vol.All(
+            cv.time_period,
+            vol.Range(
+                min=timedelta(seconds=1),
+                max=timedelta(seconds=MAX_HIGH_RATE_DURATION),
+            ),
+        ),
+        vol.Optional(
+            ATTR_INTERVAL, default=timedelta(seconds=DEFAULT_HIGH_RATE_INTERVAL)
+        ): vol.All(
+            cv.time_period, vol.Range(min=timedelta(seconds=MIN_HIGH_RATE_INTERVAL))
+        ),
+        vol.Optional(ATTR_ADDRESSES, default=DEFAULT_HIGH_RATE_ADDRESSES): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=0, max=0xFFFF))]
+        ),
+    }
+)
+
+STOP_HIGH_RATE_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> WanasCoordinator:
+    """Return the coordinator of the config entry targeted by a service call."""
+    entry = hass.config_entries.async_get_entry(call.data[ATTR_CONFIG_ENTRY_ID])
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(
+            f"Config entry {call.data[ATTR_CONFIG_ENTRY_ID]} is not a Wanas entry"
+        )
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(f"Config entry {entry.title} is not loaded")
+    return entry.runtime_data
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register Wanas services."""
+
+    @callback
+    def async_start_high_rate_sampling(call: ServiceCall) -> None:
+        """Start temporary high-rate sampling."""
+        if RECORDER_DOMAIN not in hass.config.components:
+            raise ServiceValidationError(
+                "High-rate sampling stores statistics and needs the recorder"
+            )
+        coordinator = _get_coordinator(hass, call)
+        addresses = call.data[ATTR_ADDRESSES]
+        if not coordinator.sampler.sensors_for(addresses):
+            raise ServiceValidationError(
+                f"None of the addresses {addresses} is read by a Wanas sensor"
+            )
+        coordinator.sampler.async_start(
+            call.data[ATTR_DURATION], call.data[ATTR_INTERVAL], addresses
+        )
+
+    @callback
+    def async_stop_high_rate_sampling(call: ServiceCall) -> None:
+        """Stop high-rate sampling."""
+        _get_coordinator(hass, call).sampler.async_stop()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_HIGH_RATE_SAMPLING,
+        async_start_high_rate_sampling,
+        schema=START_HIGH_RATE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_HIGH_RATE_SAMPLING,
+        async_stop_high_rate_sampling,
+        schema=STOP_HIGH_RATE_SCHEMA,
+    )
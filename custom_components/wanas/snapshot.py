@@ -0,0 +1,144 @@
+"""Compact register snapshots for Wanas integration."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+
+
+class SnapshotLayout:
+    """Address to offset index for a fixed set of read blocks.
+
+    Built once per read plan and shared by every snapshot taken with it.
+    """
+
+    def __init__(self, blocks: list[tuple[int, int]]) -> None:
+        """Initialize the layout."""
+        self.blocks = list(blocks)
+        self.offsets: list[int] = []
+        self.index: dict[int, int] = {}
+        offset = 0
+        for start, count in self.blocks:
+            self.offsets.append(offset)
+            for i in range(count):
+                self.index[start + i] = offset + i
+            offset += count
+        self.size = offset
+
+    def snapshot(self, responses: list[Sequence[int]]) -> RegisterSnapshot:
+        """Build a snapshot straight from per-block response registers.
+
+        Accepts the register lists returned by pymodbus as well as the
+        array('H') buffers returned by the native transport. Registers
+        missing from a short response are marked missing rather than read
+        as 0; extra registers in a long response are ignored.
+        """
+        values = array("H")
+        missing: set[int] = set()
+        for (_start, count), offset, registers in zip(
+            self.blocks, self.offsets, responses
+        ):
+            if (received := len(registers)) != count:
+                # Keep offsets aligned if a device answers short or long
+                registers = ([*registers] + [0] * count)[:count]
+                missing.update(range(offset + received, offset + count))
+            if isinstance(registers, array):
+                values.extend(registers)
+            else:
+                values.fromlist(registers)
+        return RegisterSnapshot(self, values, frozenset(missing))
+
+
+class RegisterSnapshot(Mapping[int, int]):
+    """Read-only mapping view over register values stored in an array('H').
+
+    Offsets in missing are part of the layout but were not returned by the
+    device; their addresses behave as if they were not in the mapping.
+    """
+
+    __slots__ = ("_index", "_layout", "_missing", "_values")
+
+    def __init__(
+        self,
+        layout: SnapshotLayout,
+        values: array,
+        missing: frozenset[int] = frozenset(),
+    ) -> None:
+        """Initialize the snapshot."""
+        self._layout = layout
+        self._index = layout.index
+        self._values = values
+        self._missing = missing
+
+    def __getitem__(self, address: int) -> int:
+        """Return the value of a register."""
+        offset = self._index[address]
+        if self._missing and offset in self._missing:
+            raise KeyError(address)
+        return self._values[offset]
+
+    def get(self, address: int, default: int | None = None) -> int | None:
+        """Return the value of a register, or default if it was not read."""
+        offset = self._index.get(address)
+        if offset is None or (self._missing and offset in self._missing):
+            return default
+        return self._values[offset]
+
+    def __contains__(self, address: object) -> bool:
+        """Return true if the register is part of the snapshot."""
+        offset = self._index.get(address)  # type: ignore[call-overload]
+        return offset is not None and offset not in self._missing
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate register addresses in read order."""
+        if not self._missing:
+            return iter(self._index)
+        missing = self._missing
+        return (a for a, offset in self._index.items() if offset not in missing)
+
+    def __len__(self) -> int:
+        """Return the number of registers held."""
+        return self._layout.size - len(self._missing)
+
+    def with_updates(self, updates: Mapping[int, int]) -> RegisterSnapshot:
+        """Return a copy with some registers replaced.
+
+        Addresses outside the layout are ignored.
+        """
+        values = array("H", self._values)
+        index = self._index
+        updated: list[int] = []
+        for address, value in updates.items():
+            if (offset := index.get(address)) is not None:
+                values[offset] = value
+                updated.append(offset)
+        missing = self._missing
+        if missing:
+            missing = missing.difference(updated)
+        return RegisterSnapshot(self._layout, values, missing)
+
+
+class RegisterRef:
+    """One register of the snapshots, located by offset.
+
+    Entities keep one per register they read; the offset is resolved when
+    the layout changes instead of hashing the address on every lookup.
+    """
+
+    __slots__ = ("_layout", "_offset", "address")
+
+    def __init__(self, address: int) -> None:
+        """Initialize the reference."""
+        self.address = address
+        self._layout: SnapshotLayout | None = None
+        self._offset: int | None = None
+
+    def get(self, snapshot: RegisterSnapshot) -> int | None:
+        """Return the register value, or None if it was not read."""
+        if snapshot._layout is not self._layout:
+            self._layout = snapshot._layout
+            self._offset = snapshot._index.get(self.address)
+        offset = self._offset
+        if offset is None or (snapshot._missing and offset in snapshot._missing):
+            return None
+        return snapshot._values[offset]
@@ -13,6 +13,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, SWITCH_DESCRIPTIONS, WanasSwitchDescription
 from .coordinator import WanasCoordinator
+from .snapshot import RegisterRef
 
 
 async def async_setup_entry(
@@ -46,6 +47,7 @@ class WanasSwitch(CoordinatorEntity[WanasCoordinator], SwitchEntity):
         self._attr_name = coordinator.registers.get(
             f"{description.key}_name", description.name
         )
+        self._verify = RegisterRef(self._verify_address)
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
             name="Wanas Rekuperator",
@@ -71,7 +73,7 @@ class WanasSwitch(CoordinatorEntity[WanasCoordinator], SwitchEntity):
         """Return true if the switch is on."""
         if self.coordinator.data is None:
             return None
-        value = self.coordinator.data.get(self._verify_address)
+        value = self._verify.get(self.coordinator.data)
         if value is None:
             return None
         return value != self._description.off_value
@@ -79,11 +81,15 @@ class WanasSwitch(CoordinatorEntity[WanasCoordinator], SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         await self.coordinator.async_write_register(
-            self._write_address, self._description.on_value
+            self._write_address,
+            self._description.on_value,
+            verify_address=self._verify_address,
         )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         await self.coordinator.async_write_register(
-            self._write_address, self._description.off_value
+            self._write_address,
+            self._description.off_value,
+            verify_address=self._verify_address,
         )
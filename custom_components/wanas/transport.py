@@ -0,0 +1,306 @@
+"""Lightweight native asyncio Modbus transport for Wanas integration.
+
+Covers only what the coordinator needs (FC3, FC6, FC16 and FC23) over
+RTU-over-TCP, MBAP/TCP and MBAP/UDP framing. Responses are decoded from
+memoryview slices into array('H') without per-register objects. The
+pymodbus client remains the default and the fallback.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from array import array
+from collections.abc import Sequence
+import struct
+import sys
+
+from .const import PROTOCOL_TCP, PROTOCOL_UDP
+
+_MBAP_HEADER = struct.Struct(">HHHB")
+_READ_REQUEST = struct.Struct(">BHH")
+_WRITE_SINGLE_REQUEST = struct.Struct(">BHH")
+_WRITE_MULTIPLE_HEADER = struct.Struct(">BHHB")
+_READ_WRITE_HEADER = struct.Struct(">BHHHHB")
+
+_SWAP_BYTES = sys.byteorder == "little"
+# Unit id plus the largest PDU allowed by the Modbus spec
+_MAX_MBAP_LENGTH = 254
+
+
+def _crc16_table() -> list[int]:
+    """Build the lookup table for the Modbus RTU CRC."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC16_TABLE = _crc16_table()
+
+
+def crc16(data: bytes | bytearray | memoryview) -> int:
+    """Compute the Modbus RTU CRC of a frame."""
+    crc = 0xFFFF
+    table = _CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+class NativeResponse:
+    """Decoded Modbus response, API compatible with what pymodbus returns."""
+
+    __slots__ = ("exception_code", "function_code", "registers")
+
+    def __init__(
+        self, function_code: int, registers: array | None = None, exception_code: int = 0
+    ) -> None:
+        """Initialize the response."""
+        self.function_code = function_code
+        self.registers = registers if registers is not None else array("H")
+        self.exception_code = exception_code
+
+    def isError(self) -> bool:  # noqa: N802
+        """Return true for exception responses."""
+        return self.exception_code != 0
+
+    def __repr__(self) -> str:
+        """Return a short description for error messages."""
+        if self.exception_code:
+            return (
+                f"NativeResponse(function_code={self.function_code}, "
+                f"exception_code={self.exception_code})"
+            )
+        return f"NativeResponse(function_code={self.function_code}, count={len(self.registers)})"
+
+
+def _decode_pdu(pdu: memoryview) -> NativeResponse:
+    """Decode a response PDU (function code onwards)."""
+    function_code = pdu[0]
+    if function_code & 0x80:
+        return NativeResponse(function_code & 0x7F, exception_code=pdu[1])
+    if function_code in (3, 23):
+        registers = array("H")
+        registers.frombytes(pdu[2 : 2 + pdu[1]])
+        if _SWAP_BYTES:
+            registers.byteswap()
+        return NativeResponse(function_code, registers)
+    return NativeResponse(function_code)
+
+
+def _rtu_frame_length(buffer: bytearray) -> int | None:
+    """Return the full length of the RTU response at the start of buffer."""
+    if len(buffer) < 3:
+        return None
+    function_code = buffer[1]
+    if function_code & 0x80:
+        return 5
+    if function_code in (3, 23):
+        return 5 + buffer[2]
+    return 8
+
+
+class _ModbusProtocol(asyncio.Protocol, asyncio.DatagramProtocol):
+    """Frame and match responses for a single outstanding request at a time."""
+
+    def __init__(self, rtu: bool) -> None:
+        """Initialize the protocol."""
+        self._rtu = rtu
+        self._buffer = bytearray()
+        self.transport: asyncio.BaseTransport | None = None
+        self.waiter: asyncio.Future[NativeResponse] | None = None
+        self.transaction_id = 0
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Store the transport."""
+        self.transport = transport
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        """Fail the pending request when the connection goes away."""
+        self.transport = None
+        self._fail(exc or ConnectionError("Connection lost"))
+
+    def error_received(self, exc: Exception) -> None:
+        """Fail the pending request on a datagram error."""
+        self._fail(exc)
+
+    def _fail(self, exc: Exception) -> None:
+        """Fail the pending request, if any."""
+        self._buffer.clear()
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_exception(exc)
+
+    def _resolve(self, response: NativeResponse) -> None:
+        """Complete the pending request."""
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(response)
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Handle a UDP datagram, which always holds one MBAP frame."""
+        self._buffer.clear()
+        self.data_received(data)
+
+    def data_received(self, data: bytes) -> None:
+        """Collect stream data and decode complete frames."""
+        buffer = self._buffer
+        buffer += data
+        while True:
+            if self._rtu:
+                length = _rtu_frame_length(buffer)
+                if length is None or len(buffer) < length:
+                    return
+                with memoryview(buffer) as view:
+                    valid = crc16(view[: length - 2]) == int.from_bytes(
+                        view[length - 2 : length], "little"
+                    )
+                    response = _decode_pdu(view[1 : length - 2]) if valid else None
+                del buffer[:length]
+                if response is None:
+                    self._fail(ConnectionError("CRC error in response"))
+                    return
+                self._resolve(response)
+            else:
+                if len(buffer) < _MBAP_HEADER.size:
+                    return
+                transaction_id, _protocol, length, _unit = _MBAP_HEADER.unpack_from(
+                    buffer
+                )
+                if not 2 <= length <= _MAX_MBAP_LENGTH:
+                    self._fail(ConnectionError("Malformed MBAP header in response"))
+                    return
+                total = 6 + length
+                if len(buffer) < total:
+                    return
+                response = None
+                # A late answer to a request that already timed out is dropped
+                if transaction_id == self.transaction_id:
+                    with memoryview(buffer) as view:
+                        response = _decode_pdu(view[_MBAP_HEADER.size : total])
+                del buffer[:total]
+                if response is not None:
+                    self._resolve(response)
+
+
+class NativeModbusClient:
+    """Minimal asyncio Modbus client with the pymodbus calls the coordinator uses."""
+
+    def __init__(self, host: str, port: int, protocol: str, timeout: float) -> None:
+        """Initialize the client."""
+        self.host = host
+        self.port = port
+        self._udp = protocol == PROTOCOL_UDP
+        self._rtu = protocol not in (PROTOCOL_TCP, PROTOCOL_UDP)
+        self._timeout = timeout
+        self._protocol = _ModbusProtocol(self._rtu)
+        self._lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        """Return true while the transport is open."""
+        transport = self._protocol.transport
+        return transport is not None and not transport.is_closing()
+
+    async def connect(self) -> bool:
+        """Open the connection; returns False on failure like pymodbus."""
+        loop = asyncio.get_running_loop()
+        try:
+            async with asyncio.timeout(self._timeout):
+                if self._udp:
+                    await loop.create_datagram_endpoint(
+                        lambda: self._protocol, remote_addr=(self.host, self.port)
+                    )
+                else:
+                    await loop.create_connection(
+                        lambda: self._protocol, self.host, self.port
+                    )
+        except (OSError, TimeoutError):
+            return False
+        return True
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._protocol.transport is not None:
+            self._protocol.transport.close()
+            self._protocol.transport = None
+        self._protocol._fail(ConnectionError("Connection closed"))
+
+    async def _async_request(self, device_id: int, pdu: bytes) -> NativeResponse:
+        """Send a request PDU and wait for the matching response."""
+        async with self._lock:
+            protocol = self._protocol
+            transport = protocol.transport
+            if transport is None or transport.is_closing():
+                raise ConnectionError("Not connected")
+            if self._rtu:
+                frame = bytes([device_id]) + pdu
+                frame += crc16(frame).to_bytes(2, "little")
+            else:
+                protocol.transaction_id = (protocol.transaction_id + 1) & 0xFFFF
+                frame = (
+                    _MBAP_HEADER.pack(protocol.transaction_id, 0, len(pdu) + 1, device_id)
+                    + pdu
+                )
+            protocol.waiter = asyncio.get_running_loop().create_future()
+            if self._udp:
+                transport.sendto(frame)  # type: ignore[attr-defined]
+            else:
+                transport.write(frame)  # type: ignore[attr-defined]
+            try:
+                async with asyncio.timeout(self._timeout):
+                    return await protocol.waiter
+            except TimeoutError:
+                # RTU frames carry no transaction id, so a late answer would
+                # be taken for the next response; drop the connection instead
+                if self._rtu:
+                    self.close()
+                raise
+            finally:
+                protocol.waiter = None
+
+    async def read_holding_registers(
+        self, address: int, *, count: int = 1, device_id: int = 1
+    ) -> NativeResponse:
+        """Read holding registers (FC3)."""
+        return await self._async_request(
+            device_id, _READ_REQUEST.pack(3, address, count)
+        )
+
+    async def write_register(
+        self, address: int, value: int, *, device_id: int = 1
+    ) -> NativeResponse:
+        """Write a single holding register (FC6)."""
+        return await self._async_request(
+            device_id, _WRITE_SINGLE_REQUEST.pack(6, address, value)
+        )
+
+    async def write_registers(
+        self, address: int, values: Sequence[int], *, device_id: int = 1
+    ) -> NativeResponse:
+        """Write multiple holding registers (FC16)."""
+        payload = struct.pack(f">{len(values)}H", *values)
+        return await self._async_request(
+            device_id,
+            _WRITE_MULTIPLE_HEADER.pack(16, address, len(values), len(payload)) + payload,
+        )
+
+    async def readwrite_registers(
+        self,
+        *,
+        read_address: int = 0,
+        read_count: int = 0,
+        write_address: int = 0,
+        values: Sequence[int] = (),
+        device_id: int = 1,
+    ) -> NativeResponse:
+        """Write then read holding registers in one request (FC23)."""
+        payload = struct.pack(f">{len(values)}H", *values)
+        return await self._async_request(
+            device_id,
+            _READ_WRITE_HEADER.pack(
+                23, read_address, read_count, write_address, len(values), len(payload)
+            )
+            + payload,
+        )
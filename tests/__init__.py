@@ -0,0 +1 @@
+"""Tests for the Wanas integration."""
@@ -0,0 +1,107 @@
+"""Helpers shared by Wanas integration tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_PORT
+
+from custom_components.wanas.const import CONF_PROTOCOL, CONF_SLAVE_ID, DOMAIN
+
+
+def make_entry(
+    data: dict[str, Any] | None = None,
+    options: dict[str, Any] | None = None,
+    state: ConfigEntryState = ConfigEntryState.SETUP_IN_PROGRESS,
+) -> ConfigEntry:
+    """Return a Wanas config entry that is not registered with hass."""
+    return ConfigEntry(
+        data={
+            CONF_HOST: "127.0.0.1",
+            CONF_PORT: 502,
+            CONF_SLAVE_ID: 1,
+            CONF_PROTOCOL: "tcp",
+            **(data or {}),
+        },
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options=options or {},
+        source="user",
+        state=state,
+        subentries_data=None,
+        title="Wanas (test)",
+        unique_id="127.0.0.1:502:1",
+        version=1,
+    )
+
+
+@dataclass
+class FakeResponse:
+    """Minimal pymodbus style response."""
+
+    registers: list[int] = field(default_factory=list)
+    exception_code: int = 0
+
+    def isError(self) -> bool:  # noqa: N802
+        """Return true for exception responses."""
+        return self.exception_code != 0
+
+
+class FakeModbusDevice:
+    """In-process stand-in for a connected Modbus client."""
+
+    def __init__(self, size: int = 256, latency: float = 0.0) -> None:
+        """Initialize the device with register n holding value n."""
+        self.registers = list(range(size))
+        self.latency = latency
+        self.connected = True
+        self.requests: list[tuple[int, int, int]] = []
+
+    async def connect(self) -> bool:
+        """Pretend to connect."""
+        self.connected = True
+        return True
+
+    def close(self) -> None:
+        """Pretend to disconnect."""
+        self.connected = False
+
+    async def read_holding_registers(
+        self, address: int, *, count: int = 1, device_id: int = 1
+    ) -> FakeResponse:
+        """Read holding registers (FC3)."""
+        self.requests.append((3, address, count))
+        await asyncio.sleep(self.latency)
+        if address + count > len(self.registers):
+            return FakeResponse(exception_code=2)
+        return FakeResponse(self.registers[address : address + count])
+
+    async def write_register(
+        self, address: int, value: int, *, device_id: int = 1
+    ) -> FakeResponse:
+        """Write a single holding register (FC6)."""
+        self.requests.append((6, address, 1))
+        await asyncio.sleep(self.latency)
+        self.registers[address] = value
+        return FakeResponse()
+
+    async def readwrite_registers(
+        self,
+        *,
+        read_address: int = 0,
+        read_count: int = 0,
+        write_address: int = 0,
+        values: Sequence[int] = (),
+        device_id: int = 1,
+    ) -> FakeResponse:
+        """Write then read holding registers (FC23)."""
+        self.requests.append((23, read_address, read_count))
+        await asyncio.sleep(self.latency)
+        self.registers[write_address : write_address + len(values)] = values
+        return FakeResponse(self.registers[read_address : read_address + read_count])
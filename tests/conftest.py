@@ -0,0 +1,34 @@
+"""Fixtures for Wanas integration tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+
+from custom_components.wanas.coordinator import WanasCoordinator
+
+from .common import FakeModbusDevice, make_entry
+
+
+@pytest.fixture
+async def hass(tmp_path: Path) -> AsyncGenerator[HomeAssistant]:
+    """Return a bare Home Assistant instance running in the test loop."""
+    hass = HomeAssistant(str(tmp_path))
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant) -> AsyncGenerator[WanasCoordinator]:
+    """Return a coordinator talking to a fake in-process device."""
+    entry = make_entry()
+    config_entries.current_entry.set(entry)
+    coordinator = WanasCoordinator(hass, entry)
+    coordinator._client = FakeModbusDevice()
+    yield coordinator
+    await coordinator.async_close()
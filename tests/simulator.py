@@ -0,0 +1,158 @@
+"""Network Modbus device simulator for Wanas tests and benchmarks.
+
+Serves holding registers over MBAP/TCP, RTU-over-TCP and MBAP/UDP on a
+local port. Setting stalled makes the device accept requests without ever
+answering, like a gateway whose serial side has hung.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+
+from custom_components.wanas.const import PROTOCOL_TCP, PROTOCOL_UDP
+from custom_components.wanas.transport import crc16
+
+_MBAP_HEADER = struct.Struct(">HHHB")
+
+
+class ModbusSimulator:
+    """Simulated Modbus device listening on 127.0.0.1."""
+
+    def __init__(self, protocol: str = PROTOCOL_TCP, size: int = 1000) -> None:
+        """Initialize the simulator with register n holding value n."""
+        self.protocol = protocol
+        self.registers = list(range(size))
+        self.stalled = False
+        self.requests = 0
+        self.port = 0
+        self._server: asyncio.Server | None = None
+        self._transport: asyncio.DatagramTransport | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    async def __aenter__(self) -> ModbusSimulator:
+        """Start serving."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop serving."""
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start listening on a free local port."""
+        if self.protocol == PROTOCOL_UDP:
+            simulator = self
+
+            class _Datagram(asyncio.DatagramProtocol):
+                def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+                    if (response := simulator._answer_mbap(data)) is not None:
+                        simulator._transport.sendto(response, addr)
+
+            loop = asyncio.get_running_loop()
+            self._transport, _protocol = await loop.create_datagram_endpoint(
+                _Datagram, local_addr=("127.0.0.1", 0)
+            )
+            self.port = self._transport.get_extra_info("sockname")[1]
+            return
+        handler = self._serve_mbap if self.protocol == PROTOCOL_TCP else self._serve_rtu
+        self._server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and drop open connections."""
+        if self._transport is not None:
+            self._transport.close()
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+
+    def _handle_pdu(self, pdu: bytes) -> bytes:
+        """Execute a request PDU and return the response PDU."""
+        registers = self.registers
+        function_code = pdu[0]
+        if function_code == 3:
+            address, count = struct.unpack_from(">HH", pdu, 1)
+            if address + count > len(registers):
+                return bytes([0x83, 2])
+            return bytes([3, 2 * count]) + struct.pack(
+                f">{count}H", *registers[address : address + count]
+            )
+        if function_code == 6:
+            address, value = struct.unpack_from(">HH", pdu, 1)
+            registers[address] = value
+            return pdu[:5]
+        if function_code == 16:
+            address, count, _size = struct.unpack_from(">HHB", pdu, 1)
+            registers[address : address + count] = struct.unpack_from(f">{count}H", pdu, 6)
+            return pdu[:5]
+        if function_code == 23:
+            read_address, read_count, write_address, write_count, _size = (
+                struct.unpack_from(">HHHHB", pdu, 1)
+            )
+            registers[write_address : write_address + write_count] = struct.unpack_from(
+                f">{write_count}H", pdu, 10
+            )
+            return bytes([23, 2 * read_count]) + struct.pack(
+                f">{read_count}H", *registers[read_address : read_address + read_count]
+            )
+        return bytes([function_code | 0x80, 1])
+
+    def _answer_mbap(self, frame: bytes) -> bytes | None:
+        """Answer one MBAP frame, or None while stalled."""
+        self.requests += 1
+        if self.stalled:
+            return None
+        transaction_id, _protocol, _length, unit = _MBAP_HEADER.unpack_from(frame)
+        response = self._handle_pdu(frame[_MBAP_HEADER.size :])
+        return _MBAP_HEADER.pack(transaction_id, 0, len(response) + 1, unit) + response
+
+    async def _serve_mbap(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve MBAP frames on a TCP connection."""
+        self._writers.add(writer)
+        try:
+            while True:
+                header = await reader.readexactly(_MBAP_HEADER.size)
+                length = _MBAP_HEADER.unpack(header)[2]
+                body = await reader.readexactly(length - 1)
+                if (response := self._answer_mbap(header + body)) is not None:
+                    writer.write(response)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _serve_rtu(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve RTU frames on a TCP connection."""
+        self._writers.add(writer)
+        try:
+            while True:
+                head = await reader.readexactly(7)
+                function_code = head[1]
+                if function_code == 16:
+                    rest = await reader.readexactly(head[6] + 2)
+                elif function_code == 23:
+                    more = await reader.readexactly(4)
+                    rest = more + await reader.readexactly(more[3] + 2)
+                else:
+                    rest = await reader.readexactly(1)
+                frame = head + rest
+                self.requests += 1
+                if self.stalled:
+                    continue
+                if crc16(frame[:-2]) != int.from_bytes(frame[-2:], "little"):
+                    continue
+                response = frame[:1] + self._handle_pdu(frame[1:-2])
+                writer.write(response + crc16(response).to_bytes(2, "little"))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
@@ -0,0 +1,103 @@
+"""Tests for the adaptive poll interval."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.wanas.coordinator import WanasCoordinator
+from custom_components.wanas.snapshot import RegisterSnapshot
+
+
+def _snapshot(
+    coordinator: WanasCoordinator, changes: dict[int, int]
+) -> RegisterSnapshot:
+    """Return a snapshot of the fake device with no timed mode running."""
+    registers = list(coordinator._client.registers)
+    for address in coordinator._timed_modes:
+        registers[address] = 0
+    for address, value in changes.items():
+        registers[address] = value
+    layout = coordinator._layout
+    return layout.snapshot(
+        [registers[start : start + count] for start, count in layout.blocks]
+    )
+
+
+def _poll(coordinator: WanasCoordinator, values: list[int]) -> list[float]:
+    """Feed one watched value per poll, spaced by the interval in force."""
+    address = coordinator._watched[0][0]
+    now = 0.0
+    intervals = []
+    for value in values:
+        coordinator._adapt_interval(_snapshot(coordinator, {address: value}), now)
+        intervals.append(coordinator.update_interval.total_seconds())
+        now += intervals[-1]
+    return intervals
+
+
+def test_steady_values_back_off_to_ceiling(coordinator: WanasCoordinator) -> None:
+    """Unchanged values lengthen the interval up to the ceiling."""
+    intervals = _poll(coordinator, [100] * 8)
+
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == coordinator.max_interval
+
+
+@pytest.mark.parametrize("drift", [0.02, 0.05, 0.1, 0.2, 0.3, 1.0])
+def test_constant_drift_settles(coordinator: WanasCoordinator, drift: float) -> None:
+    """A constant rate of change settles on one interval instead of oscillating."""
+    address = coordinator._watched[0][0]
+    now = 0.0
+    intervals = []
+    for _ in range(40):
+        value = 1000 + int(drift * now)
+        coordinator._adapt_interval(_snapshot(coordinator, {address: value}), now)
+        intervals.append(coordinator.update_interval.total_seconds())
+        now += intervals[-1]
+
+    assert len(set(intervals[-20:])) == 1
+    assert coordinator.min_interval <= intervals[-1] <= coordinator.max_interval
+
+
+def test_fast_drift_polls_at_floor(coordinator: WanasCoordinator) -> None:
+    """A fast change drives the interval down to the floor."""
+    address = coordinator._watched[0][0]
+    now = 0.0
+    for _ in range(10):
+        coordinator._adapt_interval(
+            _snapshot(coordinator, {address: 1000 + int(now)}), now
+        )
+        now += coordinator.update_interval.total_seconds()
+
+    assert coordinator.update_interval.total_seconds() == coordinator.min_interval
+
+
+def test_spike_speeds_up_then_backs_off(coordinator: WanasCoordinator) -> None:
+    """A jump shortens the interval, which grows again once values settle."""
+    intervals = _poll(coordinator, [100] * 6 + [150] + [150] * 6)
+    ceiling = coordinator.max_interval
+
+    assert intervals[5] == ceiling
+    assert intervals[6] < ceiling
+    assert intervals[7:] == sorted(intervals[7:])
+    assert intervals[-1] == ceiling
+
+
+def test_noise_does_not_speed_up(coordinator: WanasCoordinator) -> None:
+    """Changes inside the noise band count as steady at any interval."""
+    coordinator.update_interval = timedelta(seconds=coordinator.min_interval)
+    intervals = _poll(coordinator, [100, 102, 100, 101, 99, 101, 100, 102])
+
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == coordinator.max_interval
+
+
+def test_timed_mode_polls_at_floor(coordinator: WanasCoordinator) -> None:
+    """A running timed mode polls at the floor whatever the values do."""
+    timed = coordinator._timed_modes[0]
+    for now in (0.0, 30.0, 60.0):
+        coordinator._adapt_interval(_snapshot(coordinator, {timed: 15}), now)
+
+        assert coordinator.update_interval.total_seconds() == coordinator.min_interval
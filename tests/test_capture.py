@@ -0,0 +1,47 @@
+"""Tests for the Modbus traffic recorder."""
+
+from __future__ import annotations
+
+from array import array
+
+from custom_components.wanas.capture import TrafficRecorder, load_capture
+from custom_components.wanas.const import MODBUS_MAX_READ_REGISTERS
+
+
+def test_list_and_array_payloads_round_trip() -> None:
+    """Both payload kinds export big-endian and load back unchanged."""
+    recorder = TrafficRecorder(capacity=4)
+    registers = [0, 1, 0x1234, 0xFFFF]
+    buffer = array("H", registers)
+    recorder.record(3, 10, 4, registers, 0.01)
+    recorder.record(3, 10, 4, buffer, 0.01)
+    recorder.record(6, 10, 1, (), 0.02, exception_code=2)
+
+    frames = load_capture(recorder.export())
+
+    assert [frame.payload for frame in frames] == [
+        tuple(registers),
+        tuple(registers),
+        (),
+    ]
+    assert frames[2].exception_code == 2
+    # The caller's buffer is not byteswapped in place
+    assert buffer.tolist() == registers
+
+
+def test_array_payload_is_stored_big_endian() -> None:
+    """An array payload lands in the capture in wire byte order."""
+    recorder = TrafficRecorder(capacity=1)
+    recorder.record(3, 10, 4, array("H", [0, 1, 0x1234, 0xFFFF]), 0.01)
+
+    assert recorder.export()[-8:] == bytes.fromhex("000000011234ffff")
+
+
+def test_oversized_payload_is_truncated() -> None:
+    """Payloads longer than one Modbus read are cut to fit the slot."""
+    recorder = TrafficRecorder(capacity=2)
+    recorder.record(3, 0, 1, array("H", range(200)), 0.0)
+    recorder.record(3, 0, 1, list(range(200)), 0.0)
+
+    for frame in recorder.frames():
+        assert frame.payload == tuple(range(MODBUS_MAX_READ_REGISTERS))
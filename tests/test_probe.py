@@ -0,0 +1,75 @@
+"""Tests for capability probing and the probe connection handover."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+
+import custom_components.wanas as wanas
+from custom_components.wanas.config_flow import _probe_connection
+from custom_components.wanas.const import CONF_DEVICE_PROFILE, DOMAIN, MIN_TIMEOUT
+from custom_components.wanas.coordinator import WanasCoordinator
+
+from .common import FakeModbusDevice, FakeResponse, make_entry
+
+
+class _NoFC23Device(FakeModbusDevice):
+    """Device that rejects Read/Write Multiple Registers."""
+
+    async def readwrite_registers(self, **kwargs) -> FakeResponse:
+        """Answer with an illegal function exception."""
+        self.requests.append((23, kwargs["read_address"], kwargs["read_count"]))
+        return FakeResponse(exception_code=1)
+
+
+async def test_probe_reuses_connection_and_preserves_registers() -> None:
+    """The probe runs on the open client and writes back what it read."""
+    device = FakeModbusDevice(size=100)
+    device.registers[0] = 1234
+    before = list(device.registers)
+
+    profile = await _probe_connection(device, 1, {})
+
+    assert profile is not None
+    assert profile.supports_fc23
+    assert device.connected
+    assert device.registers == before
+
+
+async def test_probe_detects_missing_fc23() -> None:
+    """An illegal function answer marks FC23 unsupported."""
+    profile = await _probe_connection(_NoFC23Device(size=100), 1, {})
+    assert profile is not None
+    assert not profile.supports_fc23
+
+
+async def test_handed_over_client_uses_profile_timeout(hass: HomeAssistant) -> None:
+    """A client created before the round trip was known is bounded by it."""
+    entry = make_entry({CONF_DEVICE_PROFILE: {"rtt": 0.001}})
+    config_entries.current_entry.set(entry)
+    hass.data.setdefault(DOMAIN, {})[entry.unique_id] = FakeModbusDevice(latency=60)
+    coordinator = WanasCoordinator(hass, entry)
+    try:
+        started = time.monotonic()
+        result = await asyncio.gather(
+            coordinator._async_update_data(), return_exceptions=True
+        )
+        assert isinstance(result[0], Exception)
+        assert time.monotonic() - started < MIN_TIMEOUT * 2
+    finally:
+        await coordinator.async_close()
+
+
+async def test_remove_entry_closes_parked_client(hass: HomeAssistant) -> None:
+    """Removing an entry that was never set up releases its probe client."""
+    entry = make_entry()
+    device = FakeModbusDevice()
+    hass.data.setdefault(DOMAIN, {})[entry.unique_id] = device
+
+    await wanas.async_remove_entry(hass, entry)
+
+    assert not device.connected
+    assert entry.unique_id not in hass.data[DOMAIN]
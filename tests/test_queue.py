@@ -0,0 +1,101 @@
+"""Tests for the prioritised request queue and verify merging."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.wanas.coordinator import (
+    PRIORITY_POLL,
+    PRIORITY_WRITE,
+    WanasCoordinator,
+)
+
+
+async def test_writes_are_served_before_queued_polls(
+    coordinator: WanasCoordinator,
+) -> None:
+    """A write submitted behind polls runs right after the current request."""
+    order: list[str] = []
+    release = asyncio.Event()
+
+    def job(name: str, wait: bool = False):
+        async def call(client):
+            if wait:
+                await release.wait()
+            order.append(name)
+        return call
+
+    futures = [
+        coordinator._async_submit(PRIORITY_POLL, job("poll 1", wait=True)),
+        coordinator._async_submit(PRIORITY_POLL, job("poll 2")),
+        coordinator._async_submit(PRIORITY_POLL, job("poll 3")),
+    ]
+    await asyncio.sleep(0)
+    futures.append(coordinator._async_submit(PRIORITY_WRITE, job("write")))
+    release.set()
+    await asyncio.gather(*futures)
+
+    assert order == ["poll 1", "write", "poll 2", "poll 3"]
+
+
+async def test_write_lands_between_poll_blocks(coordinator: WanasCoordinator) -> None:
+    """A write during a poll is executed before the remaining blocks."""
+    device = coordinator._client
+    device.latency = 0.01
+    blocks = coordinator._read_blocks
+    assert len(blocks) > 1
+    address = blocks[0][0]
+
+    poll = asyncio.create_task(coordinator._async_update_data())
+    while not device.requests:
+        await asyncio.sleep(0.001)
+    await coordinator.async_write_register(address, 500, verify_address=address)
+    data = await poll
+
+    assert device.requests[:3] == [
+        (3, *blocks[0]),
+        (6, address, 1),
+        (3, address, 1),
+    ]
+    assert device.requests[3:] == [(3, *block) for block in blocks[1:]]
+    # The verify read is newer than the poll of the first block
+    assert data[address] == 500
+    # Every later block was polled after the verify, so it is pruned
+    assert coordinator._verified == {}
+
+
+async def test_newer_verify_wins(coordinator: WanasCoordinator) -> None:
+    """Verify reads newer than the poll of their block override it."""
+    address = coordinator._read_blocks[0][0]
+    coordinator._verified[address] = (10**9, 4242)
+
+    data = await coordinator._async_update_data()
+
+    assert data[address] == 4242
+    assert coordinator._verified == {address: (10**9, 4242)}
+
+
+async def test_older_verify_is_dropped(coordinator: WanasCoordinator) -> None:
+    """Verify reads older than every polled block are ignored and pruned."""
+    address = coordinator._read_blocks[0][0]
+    coordinator._verified[address] = (-1, 4242)
+
+    data = await coordinator._async_update_data()
+
+    assert data[address] == coordinator._client.registers[address]
+    assert coordinator._verified == {}
+
+
+async def test_failed_request_closes_client(coordinator: WanasCoordinator) -> None:
+    """A transport error closes the client before it is dropped."""
+    device = coordinator._client
+
+    async def fail(client):
+        raise ConnectionError("broken pipe")
+
+    with pytest.raises(ConnectionError):
+        await coordinator._async_submit(PRIORITY_POLL, fail)
+    assert not device.connected
+    assert coordinator._client is None
@@ -0,0 +1,113 @@
+"""Property tests for read planning and register decoding."""
+
+from __future__ import annotations
+
+from hypothesis import given, settings, strategies as st
+import pytest
+
+from custom_components.wanas.const import (
+    MODBUS_MAX_READ_REGISTERS,
+    SENSOR_DESCRIPTIONS,
+    RegisterDataType,
+    get_default_registers,
+)
+from custom_components.wanas.coordinator import WanasCoordinator, _build_read_blocks
+
+addresses = st.lists(
+    st.one_of(
+        st.integers(min_value=0, max_value=0xFFFF),
+        # Mostly dense maps, with some out of range entries mixed in
+        st.integers(min_value=0, max_value=400),
+        st.integers(min_value=-10, max_value=0x1000F),
+    ),
+    max_size=80,
+)
+illegal_addresses = st.lists(
+    st.integers(min_value=0, max_value=400), max_size=12
+).map(tuple)
+max_counts = st.integers(min_value=-5, max_value=300)
+max_gaps = st.integers(min_value=0, max_value=20)
+
+
+def _plan(
+    addrs: list[int], max_gap: int, max_count: int, illegal: tuple[int, ...]
+) -> list[tuple[int, int]]:
+    """Plan blocks and check invariants shared by every property."""
+    blocks = _build_read_blocks(addrs, max_gap, max_count, illegal)
+    starts = [start for start, _count in blocks]
+    assert starts == sorted(starts)
+    for (start, count), (next_start, _next_count) in zip(blocks, blocks[1:]):
+        assert start + count <= next_start
+    return blocks
+
+
+@given(addresses, max_gaps, max_counts, illegal_addresses)
+@settings(max_examples=500)
+def test_blocks_cover_every_address(
+    addrs: list[int], max_gap: int, max_count: int, illegal: tuple[int, ...]
+) -> None:
+    """Every readable address lands in exactly one block."""
+    blocks = _plan(addrs, max_gap, max_count, illegal)
+    covered = [a for start, count in blocks for a in range(start, start + count)]
+    assert len(covered) == len(set(covered))
+    wanted = {a for a in addrs if 0 <= a <= 0xFFFF and a not in illegal}
+    assert wanted <= set(covered)
+
+
+@given(addresses, max_gaps, max_counts, illegal_addresses)
+@settings(max_examples=500)
+def test_blocks_respect_register_limits(
+    addrs: list[int], max_gap: int, max_count: int, illegal: tuple[int, ...]
+) -> None:
+    """No block exceeds the protocol limit, max_count or the address space."""
+    limit = min(max(max_count, 1), MODBUS_MAX_READ_REGISTERS)
+    for start, count in _plan(addrs, max_gap, max_count, illegal):
+        assert 1 <= count <= limit
+        assert 0 <= start and start + count - 1 <= 0xFFFF
+
+
+@given(addresses, max_gaps, max_counts, illegal_addresses)
+@settings(max_examples=500)
+def test_blocks_never_span_illegal_addresses(
+    addrs: list[int], max_gap: int, max_count: int, illegal: tuple[int, ...]
+) -> None:
+    """Blocks never include an address the device rejects."""
+    for start, count in _plan(addrs, max_gap, max_count, illegal):
+        assert set(range(start, start + count)).isdisjoint(illegal)
+
+
+def test_default_register_map() -> None:
+    """The default register map reads in a few blocks."""
+    addrs = [
+        v for k, v in get_default_registers().items()
+        if k.endswith("_address") and isinstance(v, int)
+    ]
+    blocks = _build_read_blocks(addrs)
+    assert blocks
+    assert sum(count for _start, count in blocks) < 2 * len(set(addrs))
+
+
+@pytest.mark.parametrize(
+    ("data_type", "scale"),
+    sorted(
+        {(desc.data_type, desc.scale) for desc in SENSOR_DESCRIPTIONS}
+        | {(data_type, None) for data_type in RegisterDataType},
+        key=str,
+    ),
+)
+def test_decoding_round_trips(data_type: RegisterDataType, scale: float | None) -> None:
+    """Every raw register value can be recovered from its decoded value."""
+    for raw in range(0x10000):
+        value = WanasCoordinator.get_sensor_value({0: raw}, 0, data_type, scale)
+        unscaled = value if scale is None else round(value / scale)
+        if data_type == RegisterDataType.INT16:
+            assert -0x8000 <= unscaled <= 0x7FFF
+            assert (raw >= 0x8000) == (unscaled < 0)
+        else:
+            assert 0 <= unscaled <= 0xFFFF
+        assert unscaled & 0xFFFF == raw
+
+
+def test_decoding_missing_register() -> None:
+    """Registers that were not read decode to None."""
+    assert WanasCoordinator.get_sensor_value({}, 1, RegisterDataType.INT16, 0.1) is None
@@ -0,0 +1,89 @@
+"""Tests for replaying captured traffic through the coordinator."""
+
+from __future__ import annotations
+
+import pytest
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.wanas.capture import CapturedFrame
+from custom_components.wanas.coordinator import WanasCoordinator
+from custom_components.wanas.replay import ReplayClient
+
+from .common import FakeModbusDevice, make_entry
+
+
+class _FlakyDevice(FakeModbusDevice):
+    """Device whose request number fail_at times out."""
+
+    def __init__(self, fail_at: int) -> None:
+        """Initialize the device."""
+        super().__init__()
+        self.fail_at = fail_at
+
+    async def read_holding_registers(self, address: int, **kwargs):
+        """Read registers, timing out once."""
+        if len(self.requests) == self.fail_at:
+            self.requests.append((3, address, kwargs["count"]))
+            raise TimeoutError
+        return await super().read_holding_registers(address, **kwargs)
+
+
+async def _async_cycles(coordinator: WanasCoordinator, cycles: int) -> list:
+    """Run poll cycles and return their data, or the error they raised."""
+    results = []
+    for _ in range(cycles):
+        try:
+            results.append(dict(await coordinator._async_update_data()))
+        except UpdateFailed as err:
+            results.append(type(err))
+        if isinstance(coordinator._client, FakeModbusDevice):
+            coordinator._client.registers = [
+                value + 1 for value in coordinator._client.registers
+            ]
+    return results
+
+
+async def test_replay_session_with_timeout(hass: HomeAssistant) -> None:
+    """A recorded session with a timeout replays cycle by cycle."""
+    entry = make_entry()
+    config_entries.current_entry.set(entry)
+
+    device = _FlakyDevice(fail_at=len(WanasCoordinator(hass, entry)._read_blocks))
+    recording = WanasCoordinator(hass, entry, client_factory=lambda: device)
+    try:
+        recorded = await _async_cycles(recording, 4)
+    finally:
+        await recording.async_close()
+    assert recorded[1] is UpdateFailed
+    assert all(isinstance(result, dict) for i, result in enumerate(recorded) if i != 1)
+
+    replay = ReplayClient.from_capture(recording.capture.export())
+    replaying = WanasCoordinator(hass, entry, client_factory=lambda: replay)
+    try:
+        replayed = await _async_cycles(replaying, 4)
+    finally:
+        await replaying.async_close()
+
+    assert replayed == recorded
+    assert replay.finished
+    assert replay.unmatched == 0
+
+
+async def test_replay_resyncs_after_divergence() -> None:
+    """A request matching a later frame skips the frames in between."""
+    frames = [
+        CapturedFrame(0.0, 0.0, 3, 0, address, 1, (value,))
+        for address, value in ((1, 10), (2, 20), (3, 30), (1, 11))
+    ]
+    replay = ReplayClient(frames)
+
+    assert (await replay.read_holding_registers(3)).registers == [30]
+    assert replay.skipped == 2
+    assert (await replay.read_holding_registers(1)).registers == [11]
+    assert replay.finished
+    # Served from the register image built from the skipped frames
+    assert (await replay.read_holding_registers(2)).registers == [20]
+    assert replay.unmatched == 1
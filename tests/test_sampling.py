@@ -0,0 +1,78 @@
+"""Tests for high-rate sampling."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.wanas import sampling
+from custom_components.wanas.const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    DOMAIN,
+    SERVICE_START_HIGH_RATE_SAMPLING,
+)
+from custom_components.wanas.coordinator import WanasCoordinator
+from custom_components.wanas.services import async_setup_services
+
+
+@pytest.fixture
+def statistics(monkeypatch: pytest.MonkeyPatch) -> list[tuple[Any, list[Any]]]:
+    """Capture external statistics instead of writing them to a recorder."""
+    written: list[tuple[Any, list[Any]]] = []
+    monkeypatch.setattr(
+        sampling,
+        "async_add_external_statistics",
+        lambda hass, metadata, stats: written.append((metadata, list(stats))),
+    )
+    return written
+
+
+async def _async_run(coordinator: WanasCoordinator, samples: int) -> None:
+    """Run a sampling pass of roughly the given number of samples."""
+    coordinator.sampler.async_start(
+        timedelta(seconds=samples * 0.01), timedelta(seconds=0.01), [0]
+    )
+    while coordinator.sampler.active:
+        await asyncio.sleep(0.01)
+
+
+async def test_buckets_survive_restart(
+    coordinator: WanasCoordinator, statistics: list[tuple[Any, list[Any]]]
+) -> None:
+    """Restarting within an hour extends the aggregate instead of replacing it."""
+    device = coordinator._client
+    await _async_run(coordinator, 5)
+    first = len(device.requests)
+    await _async_run(coordinator, 5)
+    total = len(device.requests)
+    assert first > 0 and total > first
+
+    metadata, stats = statistics[-1]
+    hourly = coordinator.sampler._buckets[metadata["statistic_id"]]
+    assert sum(bucket.count for bucket in hourly.values()) == total
+    assert len(stats) == len(hourly)
+
+
+def test_sensors_for_unmapped_addresses(coordinator: WanasCoordinator) -> None:
+    """Addresses that no sensor reads select nothing."""
+    assert coordinator.sampler.sensors_for([0xFFFF]) == {}
+    assert coordinator.sampler.sensors_for([0])
+
+
+async def test_start_requires_recorder(hass: HomeAssistant) -> None:
+    """Sampling is refused while the recorder is not loaded."""
+    async_setup_services(hass)
+    with pytest.raises(ServiceValidationError, match="recorder"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_START_HIGH_RATE_SAMPLING,
+            {ATTR_CONFIG_ENTRY_ID: "missing", ATTR_DURATION: 60},
+            blocking=True,
+        )
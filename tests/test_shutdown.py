@@ -0,0 +1,100 @@
+"""Tests for unload and reload against a stalled device."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from homeassistant import config_entries
+from homeassistant.const import CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+import custom_components.wanas as wanas
+from custom_components.wanas.const import (
+    CONF_DEVICE_PROFILE,
+    MIN_TIMEOUT,
+    SHUTDOWN_TIMEOUT,
+)
+from custom_components.wanas.coordinator import WanasCoordinator
+
+from .common import make_entry
+from .simulator import ModbusSimulator
+
+# Profile whose round trip yields the shortest request timeout
+FAST_PROFILE = {"rtt": 0.001}
+# Profile whose round trip yields the longest request timeout
+SLOW_PROFILE = {"rtt": 10.0}
+# Requests, including client retries, are bounded by the profile timeout
+SETUP_BUDGET = MIN_TIMEOUT + SHUTDOWN_TIMEOUT
+
+
+@pytest.fixture
+async def stalled_device() -> ModbusSimulator:
+    """Return a simulated device that accepts requests but never answers."""
+    async with ModbusSimulator() as simulator:
+        simulator.stalled = True
+        yield simulator
+
+
+async def test_unload_with_request_in_flight(
+    hass: HomeAssistant, stalled_device: ModbusSimulator
+) -> None:
+    """Closing does not wait for the request timeout of a stalled device."""
+    entry = make_entry(
+        {CONF_PORT: stalled_device.port, CONF_DEVICE_PROFILE: SLOW_PROFILE}
+    )
+    config_entries.current_entry.set(entry)
+    coordinator = WanasCoordinator(hass, entry)
+    poll = asyncio.create_task(coordinator._async_update_data())
+    write = asyncio.create_task(coordinator.async_write_register(40, 1))
+    while stalled_device.requests == 0:
+        await asyncio.sleep(0.01)
+
+    worker = coordinator._worker
+    started = time.monotonic()
+    await coordinator.async_close()
+    elapsed = time.monotonic() - started
+
+    assert coordinator._timeout > SHUTDOWN_TIMEOUT
+    assert elapsed < SHUTDOWN_TIMEOUT
+    assert worker.done()
+    for task in (poll, write):
+        with pytest.raises(UpdateFailed):
+            await task
+
+
+async def test_reload_with_stalled_device(
+    hass: HomeAssistant,
+    stalled_device: ModbusSimulator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A failed setup releases its worker and client, so reloads stay bounded."""
+    created: list[WanasCoordinator] = []
+
+    class RecordingCoordinator(WanasCoordinator):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(wanas, "WanasCoordinator", RecordingCoordinator)
+    entry = make_entry(
+        {CONF_PORT: stalled_device.port, CONF_DEVICE_PROFILE: FAST_PROFILE}
+    )
+    config_entries.current_entry.set(entry)
+    for _attempt in range(2):
+        started = time.monotonic()
+        with pytest.raises(ConfigEntryNotReady):
+            await wanas.async_setup_entry(hass, entry)
+        elapsed = time.monotonic() - started
+
+        coordinator = created[-1]
+        assert coordinator._closing
+        assert coordinator._worker is None or coordinator._worker.done()
+        assert coordinator._client is None or not coordinator._client.connected
+        assert elapsed < SETUP_BUDGET
+
+    assert len(created) == 2
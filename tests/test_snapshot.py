@@ -0,0 +1,74 @@
+"""Tests for register snapshots."""
+
+from __future__ import annotations
+
+from array import array
+
+from hypothesis import given, strategies as st
+
+from custom_components.wanas.snapshot import RegisterRef, SnapshotLayout
+
+BLOCKS = [(0, 8), (29, 20), (55, 3), (63, 5)]
+
+
+def _as_dict(responses: list[list[int]]) -> dict[int, int]:
+    """Build the register dict the way per-register storage would."""
+    data: dict[int, int] = {}
+    for (start, count), registers in zip(BLOCKS, responses):
+        for i, value in enumerate(registers[:count]):
+            data[start + i] = value
+    return data
+
+
+@given(
+    st.tuples(
+        *(
+            st.lists(st.integers(min_value=0, max_value=0xFFFF), max_size=count + 3)
+            for _start, count in BLOCKS
+        )
+    )
+)
+def test_snapshot_matches_dict(responses: tuple[list[int], ...]) -> None:
+    """A snapshot holds exactly the registers a dict would, even for odd lengths."""
+    snapshot = SnapshotLayout(BLOCKS).snapshot(list(responses))
+    expected = _as_dict(list(responses))
+    assert dict(snapshot) == expected
+    assert len(snapshot) == len(expected)
+    for start, count in BLOCKS:
+        for address in range(start, start + count):
+            assert snapshot.get(address) == expected.get(address)
+            assert (address in snapshot) == (address in expected)
+
+
+def test_short_response_is_missing_not_zero() -> None:
+    """Registers a device did not return read as unknown."""
+    layout = SnapshotLayout(BLOCKS)
+    responses = [list(range(count)) for _start, count in BLOCKS]
+    responses[1] = array("H", [7, 8])
+    snapshot = layout.snapshot(responses)
+
+    assert snapshot[29] == 7
+    assert snapshot[30] == 8
+    assert snapshot.get(31) is None
+    assert 31 not in snapshot
+    assert snapshot.get(1000) is None
+
+    updated = snapshot.with_updates({31: 5, 1000: 1})
+    assert updated[31] == 5
+    assert updated.get(32) is None
+    assert 1000 not in updated
+    assert snapshot.get(31) is None
+
+
+def test_register_ref_follows_layout() -> None:
+    """A reference reads like get and re-resolves its offset for a new layout."""
+    layout = SnapshotLayout(BLOCKS)
+    responses = [list(range(start, start + count)) for start, count in BLOCKS]
+    responses[1] = responses[1][:2]
+    snapshot = layout.snapshot(responses)
+    refs = [RegisterRef(address) for address in (0, 30, 31, 64, 1000)]
+
+    assert [ref.get(snapshot) for ref in refs] == [0, 30, None, 64, None]
+
+    other = SnapshotLayout([(30, 2), (1000, 1)]).snapshot([[7, 8], [9]])
+    assert [ref.get(other) for ref in refs] == [None, 7, 8, None, 9]
@@ -0,0 +1,82 @@
+"""Tests for register writes with FC23 and the FC6 fallback."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from custom_components.wanas.coordinator import WanasCoordinator
+from custom_components.wanas.probe import ILLEGAL_FUNCTION, WanasDeviceProfile
+
+from .common import FakeModbusDevice, FakeResponse
+
+
+class _NoFC23Device(FakeModbusDevice):
+    """Device answering FC23 with ILLEGAL_FUNCTION."""
+
+    async def readwrite_registers(
+        self,
+        *,
+        read_address: int = 0,
+        read_count: int = 0,
+        write_address: int = 0,
+        values: Sequence[int] = (),
+        device_id: int = 1,
+    ) -> FakeResponse:
+        """Reject the request without writing."""
+        self.requests.append((23, read_address, read_count))
+        return FakeResponse(exception_code=ILLEGAL_FUNCTION)
+
+
+async def test_write_uses_single_fc23_request(coordinator: WanasCoordinator) -> None:
+    """With FC23 the write and the verify block read are one request."""
+    coordinator._apply_profile(WanasDeviceProfile(supports_fc23=True))
+    start, count = coordinator._read_blocks[0]
+    device = coordinator._client
+
+    await coordinator.async_write_register(start, 500, verify_address=start + 1)
+
+    assert device.requests == [(23, start, count)]
+    assert device.registers[start] == 500
+
+
+async def test_write_falls_back_to_fc6(coordinator: WanasCoordinator) -> None:
+    """ILLEGAL_FUNCTION downgrades the profile and retries with FC6."""
+    device = _NoFC23Device()
+    coordinator._client = device
+    coordinator._apply_profile(WanasDeviceProfile(supports_fc23=True))
+    start, count = coordinator._read_blocks[0]
+
+    await coordinator.async_write_register(start, 500, verify_address=start + 1)
+
+    assert not coordinator.profile.supports_fc23
+    assert device.requests == [
+        (23, start, count),
+        (6, start, 1),
+        (3, start + 1, 1),
+    ]
+    assert device.registers[start] == 500
+
+    # Later writes skip FC23 altogether
+    device.requests.clear()
+    await coordinator.async_write_register(start, 501, verify_address=start + 1)
+    assert device.requests == [(6, start, 1), (3, start + 1, 1)]
+
+
+async def test_fc23_block_is_merged(coordinator: WanasCoordinator) -> None:
+    """Every register of the FC23 read back replaces the polled value."""
+    coordinator._apply_profile(WanasDeviceProfile(supports_fc23=True))
+    coordinator.data = await coordinator._async_update_data()
+    start, count = coordinator._read_blocks[0]
+    device = coordinator._client
+    assert count > 1
+    # Changed on the device since the poll, only visible through the read back
+    last = start + count - 1
+    device.registers[last] = 999
+
+    await coordinator.async_write_register(start, 500, verify_address=start)
+
+    assert coordinator.data[start] == 500
+    assert coordinator.data[last] == 999
+    for address in range(start, start + count):
+        assert coordinator.data[address] == device.registers[address]
+    assert set(coordinator._verified) == set(range(start, start + count))